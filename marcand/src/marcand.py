@@ -9,11 +9,13 @@
 
 # 1.1 Standard library imports
 import os
-import gc
+import math
 import time
 import logging
 from typing import Callable, Tuple, List, Dict, Optional
-from collections import defaultdict, Counter
+from collections import Counter
+from functools import lru_cache
+from statistics import fmean
 from datetime import datetime
 from pathlib import Path
 from itertools import groupby
@@ -25,16 +27,79 @@ from tqdm import tqdm
 
 # 1.2 Third-party library imports
 import numpy as np
-from scipy.stats import gamma
+from numba import njit, prange, get_num_threads, get_thread_id, types
 import pyarrow as pa
 import pyarrow.parquet as pq
 import matplotlib.pyplot as plt
 
+# Optional : faster histograms on uniform bins
+try:
+    from fast_histogram import histogram1d, histogram2d
+except ImportError:
+    histogram1d, histogram2d = None, None
+
 
 # 1.3 Matplotlib configuration
 plt.rcParams['font.size'] = 8
 
 
+# 1.4 Random number generator (reseeded in forked workers so that they do not share a stream)
+RNG = np.random.default_rng()
+
+
+def reseed_rng() -> None:
+    """
+    Replace the module generator by a freshly seeded one.
+    """
+    global RNG
+    RNG = np.random.default_rng()
+
+
+os.register_at_fork(after_in_child=reseed_rng)
+
+
+# 1.5 Numba types of the read-only inputs (accept writable arrays and broadcast views)
+readonly_f32_1d = types.Array(types.float32, 1, 'A', readonly=True)
+readonly_f64_1d = types.Array(types.float64, 1, 'A', readonly=True)
+readonly_f64_1d_c = types.Array(types.float64, 1, 'C', readonly=True)
+
+# Largest time that the float32 results matrix can hold (longer times are clamped to it instead of becoming inf)
+F32_MAX = float(np.finfo(np.float32).max)
+
+
+# 1.6 Parquet schema of the results written by sw_marcand (no type inference at writing)
+_int = pa.int64()
+_float = pa.float64()
+_list_f32 = pa.list_(pa.float32())
+_list_f64 = pa.list_(pa.float64())
+_matrix_f32 = pa.list_(pa.list_(pa.float32()))
+
+SCHEMA = pa.schema([
+    ('alpha_choice', pa.string()), ('gap', _int), ('bpmin', _int), ('mu', _float), ('theta', _float),
+    ('nt', _int), ('dt', _int), ('N', _int),
+    ('alphao', _float), ('alphaf', _float), ('beta', _float),
+    ('total_lenght', _int), ('origin', _int), ('bps', _int),
+
+    ('alpha_mean', _list_f32),
+    ('obs_points', _list_f64), ('obs_distrib', _list_f64),
+    ('link_points', _list_f64), ('link_distrib', _list_f64),
+
+    ('p', _list_f64),
+
+    ('results', _matrix_f32),
+    ('fpt_mean', _list_f32), ('fpt_2D', _matrix_f32), ('fpt_x_max_distrib', _list_f32), ('p_tau', _list_f32),
+    ('v_marcand', _float), ('delay', _list_f32),
+
+    ('bin_fpt', _int), ('fpt_distrib_2D', _matrix_f32), ('fpt_number', _list_f32),
+
+    ('tbj_points', pa.list_(pa.int64())), ('tbj_distrib', _list_f64),
+
+    ('dx_points', _list_f64), ('dx_distrib', _list_f64), ('dx_mean', _float), ('dx_med', _float), ('dx_mp', _float),
+    ('dt_points', _list_f64), ('dt_distrib', _list_f64), ('dt_mean', _float), ('dt_med', _float), ('dt_mp', _float),
+    ('vi_points', _list_f64), ('vi_distrib', _list_f64), ('vi_mean', _float), ('vi_med', _float), ('vi_mp', _float),
+])
+
+
 # ================================================
 # Part 2.1 : General functions
 # ================================================
@@ -55,17 +120,8 @@ def add_dicts(dict1: Dict, dict2: Dict) -> Dict:
         dict: A new dictionary with keys from both dictionaries, 
               where the values are the sum of the values from dict1 and dict2.
     """
-    merged_dict = defaultdict(int)
-
-    # Add values from dict1 to merged_dict
-    for key, value in dict1.items():
-        merged_dict[key] += value
-
-    # Add values from dict2 to merged_dict
-    for key, value in dict2.items():
-        merged_dict[key] += value
-
-    return dict(merged_dict)
+    # Keys of dict1 then new keys of dict2 (Counter addition would drop non-positive sums)
+    return {key: dict1.get(key, 0) + dict2.get(key, 0) for key in {**dict1, **dict2}}
 
 
 def compute_mean_from_dict(input_dict: dict) -> dict:
@@ -82,7 +138,7 @@ def compute_mean_from_dict(input_dict: dict) -> dict:
     mean_dict = {}
     for key, values in input_dict.items():
         if isinstance(values, list):
-            mean_dict[key] = np.mean(np.array(values))
+            mean_dict[key] = fmean(values) if values else np.nan
     return mean_dict
 
 
@@ -114,9 +170,18 @@ def calculate_distribution(
     if data.size == 0: 
         return np.array([]), np.array([])
 
-    # Points and not bins
-    bins_array = np.arange(first_bin, last_bin + bin_width, bin_width)
-    distrib, bins_edges = np.histogram(data, bins=bins_array)
+    # Uniform bins : same edges as np.arange(first_bin, last_bin + bin_width, bin_width), without building them
+    n_bins = math.ceil((last_bin + bin_width - first_bin) / bin_width) - 1
+    upper_bin = first_bin + n_bins * bin_width
+
+    # Last edge included, as in np.histogram
+    if histogram1d is not None:
+        distrib = histogram1d(data, bins=n_bins, range=(first_bin, upper_bin))
+        distrib[-1] += np.count_nonzero(data == upper_bin)
+    else:
+        inside = (data >= first_bin) & (data <= upper_bin)
+        bin_index = np.minimum(((data[inside] - first_bin) // bin_width).astype(np.int64), n_bins - 1)
+        distrib = np.bincount(bin_index, minlength=n_bins)
 
     # Normalizing without generating NaNs
     if np.sum(distrib) > 0:
@@ -124,7 +189,8 @@ def calculate_distribution(
     else:
         distrib = np.zeros_like(distrib)
 
-    points = (bins_edges[:-1] + bins_edges[1:]) / 2
+    # Points and not bins
+    points = first_bin + (np.arange(n_bins) + 0.5) * bin_width
 
     # Return the bin centers and the normalized distribution
     return points, distrib
@@ -152,26 +218,51 @@ def linear_fit(values: np.ndarray, time_step: float, start_index: int, end_index
     return slope[0]
 
 
-def hist_on_columns(array_2d: np.ndarray, bin_width=1e1, bin_max=1e4) -> np.ndarray:
+@njit(cache=True, parallel=True)
+def column_mean_and_histogram(array_2d: np.ndarray, bin_width: float, n_bins: int) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Compute a normalized histogram for each column of a 2D array.
+    Fused np.nanmean(axis=0) and normalized histogram of each column : both statistics in a single pass over the array.
+    Columns are processed by blocks so that each row segment is read contiguously.
 
     Args:
         array_2d (np.ndarray): 2D array where each column contains a distribution of values.
+        bin_width (float): Width of the bins, starting from 0.
+        n_bins (int): Number of bins (last edge included).
 
     Returns:
-        np.ndarray: 2D array where each row corresponds to the normalized histogram of a column.
-    """
-    bin_edges = np.arange(0, bin_max + 2, bin_width)
-
-    n_columns = array_2d.shape[1]
-    histograms = np.empty(n_columns, dtype=object)
-
-    for col_index in range(n_columns):
-        counts, _ = np.histogram(array_2d[:, col_index], bins=bin_edges)
-        histograms[col_index] = counts / np.sum(counts)
-
-    return np.vstack(histograms)
+        Tuple[np.ndarray, np.ndarray]: Mean of each column (NaN ignored), normalized histogram of each column, in float32.
+            The sums are accumulated in float64.
+    """
+    n_rows, n_columns = array_2d.shape
+    upper = n_bins * bin_width
+    block = 64
+    means = np.empty(n_columns, dtype=np.float32)
+    histograms = np.zeros((n_columns, n_bins), dtype=np.float32)
+
+    for first in prange((n_columns + block - 1) // block):
+        start = first * block
+        stop = min(start + block, n_columns)
+        totals = np.zeros(stop - start)
+        counts = np.zeros(stop - start, dtype=np.int64)
+
+        for i in range(n_rows):
+            for j in range(start, stop):
+                value = np.float64(array_2d[i, j])
+                if not np.isnan(value):
+                    totals[j - start] += value
+                    counts[j - start] += 1
+                    if 0 <= value <= upper:
+                        histograms[j, min(int(value // bin_width), n_bins - 1)] += 1
+
+        for j in range(start, stop):
+            means[j] = totals[j - start] / counts[j - start] if counts[j - start] > 0 else np.nan
+            in_range = histograms[j].sum()
+            if in_range > 0:
+                histograms[j] /= in_range
+            else:
+                histograms[j] = np.nan
+
+    return means, histograms
 
 
 # ================================================
@@ -214,6 +305,33 @@ def proba_tataki(R: float, L: float, lp: float) -> float:
     return PLR
 
 
+@njit("float64[::1](float64[::1], float64, float64)", cache=True)
+def gamma_pdf(L: np.ndarray, a: float, scale: float) -> np.ndarray:
+    """
+    Closed-form probability density function of a Gamma distribution (same values as scipy.stats.gamma.pdf).
+
+    Args:
+        L (np.ndarray): Values at which to evaluate the density.
+        a (float): Shape parameter of the Gamma distribution.
+        scale (float): Scale parameter of the Gamma distribution.
+
+    Returns:
+        np.ndarray: Probability density at each value of L.
+    """
+    log_norm = math.lgamma(a) + a * np.log(scale)
+    pdf = np.zeros(L.shape[0])
+    for i in range(L.shape[0]):
+        x = L[i]
+        if x > 0:
+            pdf[i] = np.exp((a - 1) * np.log(x) - x / scale - log_norm)
+        elif x == 0:
+            if a < 1:
+                pdf[i] = np.inf
+            elif a == 1:
+                pdf[i] = 1 / scale
+    return pdf
+
+
 def proba_gamma(mu: float, theta: float, L: float) -> float:
     """
     Compute the probability density function (PDF) of a Gamma distribution.
@@ -228,7 +346,7 @@ def proba_gamma(mu: float, theta: float, L: float) -> float:
     """
     alpha_gamma = mu**2 / theta**2                              # Calculate the shape parameter (alpha) of the Gamma distribution
     beta_gamma = theta**2 / mu                                  # Calculate the scale parameter (beta) of the Gamma distribution
-    p_gamma = gamma.pdf(L, a=alpha_gamma, scale=beta_gamma)     # Compute the probability density for the value L
+    p_gamma = gamma_pdf(np.ascontiguousarray(L, dtype=np.float64), alpha_gamma, beta_gamma)    # Compute the probability density for the value L
 
     p_gamma = p_gamma / np.sum(p_gamma)
 
@@ -255,6 +373,7 @@ def generate_accessible_landscape(alphaf: float, length: int, nt: int) -> np.nda
     return np.full((nt, length), fill_value=alphaf, dtype=np.float32)
 
 
+@lru_cache(maxsize=32)
 def calculate_landscape(
     alpha_choice: str,
     alphaf: float,
@@ -285,55 +404,71 @@ def calculate_landscape(
         nt (int): Number of trajectories.
 
     Returns:
-        np.ndarray: Alpha landscape of shape (nt, total_length)
+        np.ndarray: Alpha landscape of shape (nt, total_length), in float32 (read-only view of a single line)
+
+    Note:
+        Results are memoized on the arguments : the landscape is deterministic and read-only,
+        so every (mu, theta) pair of a sweep shares the same array.
     """
 
-    # Unit (used for 'constant' and 'constant_max' cases)
-    unit = np.array(
-        d * [alphaf] +
-        (rap1_l * [alphao] + [alphaf] + rap1_l * [alphao] + gap * [alphaf]) * (int(N - 1)) +
-        (rap1_l * [alphao] + [alphaf] + rap1_l * [alphao]) +
-        D * [alphaf]
-    )
-    unit_length = len(unit)
+    N = int(N)
+
+    # Unit : N Rap1 blocks (rap1_l obstacles, one free unit, rap1_l obstacles) separated by gap free units
+    rap1_stride = 2 * rap1_l + 1 + gap
+    unit_length = d + (N - 1) * rap1_stride + 2 * rap1_l + 1 + D
+    unit = np.full(unit_length, fill_value=alphaf, dtype=np.float32)
+    rap1_starts = d + np.arange(N) * rap1_stride
+    place_obstacles(unit, rap1_starts, rap1_l, alphao)
+    place_obstacles(unit, rap1_starts + rap1_l + 1, rap1_l, alphao)
     unit_mean = np.mean(unit)
 
     # ---- I : array of gap ---- #
     if alpha_choice == 'array':
-        landscape = np.tile(unit, (nt, 1))
+        line = binding_length(unit, alphaf, alphao, bpmin)
 
     # ---- II : array with LacI ---- #
     elif alpha_choice == 'LacI':
-        base_pattern = (
-            d * [alphaf] +
-            (rap1_l * [alphao] + [alphaf] + rap1_l * [alphao] +
-             3 * [alphaf] + lacO_l * [alphao] + 8 * [alphaf]) * (int(N - 1)) +
-            (rap1_l * [alphao] + [alphaf] + rap1_l * [alphao]) +
-            D * [alphaf]
-        )
-        landscape = np.tile(np.array(base_pattern), (nt, 1))
+        # Each Rap1 block (except the last one) is followed by 3 free units, lacO_l obstacles and 8 free units
+        lacI_stride = 2 * rap1_l + 1 + 3 + lacO_l + 8
+        base_pattern = np.full(d + (N - 1) * lacI_stride + 2 * rap1_l + 1 + D, fill_value=alphaf, dtype=np.float32)
+        rap1_starts = d + np.arange(N) * lacI_stride
+        place_obstacles(base_pattern, rap1_starts, rap1_l, alphao)
+        place_obstacles(base_pattern, rap1_starts + rap1_l + 1, rap1_l, alphao)
+        place_obstacles(base_pattern, rap1_starts[:-1] + 2 * rap1_l + 1 + 3, lacO_l, alphao)
+        line = binding_length(base_pattern, alphaf, alphao, bpmin)
 
     # ---- III : Constant value (mean) ---- #
     elif alpha_choice == 'constant':
-        landscape = np.full((nt, unit_length), fill_value=unit_mean)
+        line = np.full(unit_length, fill_value=unit_mean, dtype=np.float32)
 
     # ---- IV : Constant max value ---- #
     elif alpha_choice == 'constant_max':
-        landscape = np.full((nt, unit_length), fill_value=alphaf)
+        line = np.full(unit_length, fill_value=alphaf, dtype=np.float32)
 
     else:
         raise ValueError(
             f"Invalid alpha_choice: '{alpha_choice}'. Must be one of ['array', 'LacI', 'constant', 'constant_max']."
         )
 
-    # Minimal condensin binding size
-    if alpha_choice in ["array", "LacI"] :
-        corrected_line = binding_length(landscape[0], alphaf, alphao, bpmin)
-        landscape = np.tile(corrected_line, (nt, 1))
+    # Same landscape for every trajectory : read-only view, no copy
+    landscape = np.broadcast_to(line, (nt, len(line)))
 
     return landscape
 
 
+def place_obstacles(line: np.ndarray, starts: np.ndarray, width: int, alphao: float) -> None:
+    """
+    Write blocks of obstacles in a landscape line, in place.
+
+    Args:
+        line (np.ndarray): Landscape line to modify.
+        starts (np.ndarray): First position of each block.
+        width (int): Number of obstacle units per block.
+        alphao (float): Alpha value in obstacle regions.
+    """
+    line[(starts[:, np.newaxis] + np.arange(width)).ravel()] = alphao
+
+
 def binding_length(alpha_list: np.ndarray, alphao: float, alphaf: float, bpmin: int) -> np.ndarray:
     """
     Modifies sequences of consecutive `alphaf` values in an array if their length is less than `bpmin`.
@@ -372,15 +507,17 @@ def binding_length(alpha_list: np.ndarray, alphao: float, alphaf: float, bpmin:
     mask = alpha_array == alphaf        # Identify indices where the values are equal to `alphaf`
 
     # Find start and end indices of consecutive sequences of `alphaf`
-    diffs = np.diff(np.concatenate(([0], mask.astype(int), [0])))
-    starts = np.where(diffs == 1)[0]    # Start of sequences
-    ends = np.where(diffs == -1)[0]     # End of sequences
-
-    # Iterate over sequences and replace if the length is less than `bpmin`
-    for start, end in zip(starts, ends):
-        length = end - start
-        if length < bpmin:
-            alpha_array[start:end] = alphao
+    # (the int8 view of the boolean mask is free, the zero edges are handled by prepend / append)
+    edges = np.flatnonzero(np.diff(mask.view(np.int8), prepend=np.int8(0), append=np.int8(0)))
+    starts = edges[::2]                 # Start of sequences
+    ends = edges[1::2]                  # End of sequences
+
+    # Mark the sequences shorter than `bpmin` (+1 at their start, -1 after their end) and replace them
+    short = (ends - starts) < bpmin
+    delta = np.zeros(len(alpha_array) + 1, dtype=np.int8)
+    delta[starts[short]] = 1
+    delta[ends[short]] = -1
+    alpha_array[np.cumsum(delta[:-1]) > 0] = alphao
 
     return alpha_array
 
@@ -403,31 +540,64 @@ def find_blocks(array: np.ndarray, alpha_value: float) -> List[Tuple[int, int]]:
     List[Tuple[int, int]]
         A list of intervals (start_index, end_index) for each contiguous obstacle block.
     """
-    array = np.asarray(array)
-    is_block = np.isclose(array, alpha_value, atol=1e-8)
-    diff = np.diff(is_block.astype(int))
-    starts = np.where(diff == 1)[0] + 1
-    ends = np.where(diff == -1)[0] + 1
+    starts, ends = find_block_bounds(np.asarray(array, dtype=np.float64), alpha_value)
+    return list(zip(starts, ends))
 
-    if is_block[0]:
-        starts = np.insert(starts, 0, 0)
-    if is_block[-1]:
-        ends = np.append(ends, len(array))
 
-    return list(zip(starts, ends))
+@njit(
+    [
+        types.Tuple((types.int64[::1], types.int64[::1]))(readonly_f32_1d, types.float64),
+        types.Tuple((types.int64[::1], types.int64[::1]))(readonly_f64_1d, types.float64),
+    ],
+    cache=True
+)
+def find_block_bounds(array: np.ndarray, alpha_value: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Single-pass version of find_blocks returning the bounds as two arrays.
+
+    Args:
+        array (np.ndarray): The array representing the full environment.
+        alpha_value (float): The value of the blocks (same tolerance as np.isclose with atol=1e-8).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Start indices (inclusive) and end indices (exclusive) of the blocks.
+    """
+    n = array.shape[0]
+    starts = np.empty(n // 2 + 1, dtype=np.int64)
+    ends = np.empty(n // 2 + 1, dtype=np.int64)
+    tolerance = 1e-8 + 1e-5 * abs(alpha_value)
+
+    n_blocks = 0
+    previous = False
+    for i in range(n):
+        current = abs(array[i] - alpha_value) <= tolerance
+        if current and not previous:
+            starts[n_blocks] = i
+        elif previous and not current:
+            ends[n_blocks] = i
+            n_blocks += 1
+        previous = current
+    if previous:
+        ends[n_blocks] = n
+        n_blocks += 1
+
+    return starts[:n_blocks], ends[:n_blocks]
 
 
 def find_interval_containing_value(
-    intervals: List[Tuple[int, int]], value: int
+    starts: np.ndarray, ends: np.ndarray, value: int
 ) -> Optional[Tuple[int, int]]:
     """
-    Return the first interval (start, end) that contains the specified value.
+    Return the interval (start, end) that contains the specified value.
 
     Parameters
     ----------
-    intervals : List[Tuple[int, int]]
-        A list of intervals (start, end) sorted or unsorted.
-    
+    starts : np.ndarray
+        Sorted start indices (inclusive) of non-overlapping intervals, as returned by find_block_bounds.
+
+    ends : np.ndarray
+        End indices (exclusive) of the same intervals.
+
     value : int
         The index or position to locate within the intervals.
 
@@ -436,12 +606,9 @@ def find_interval_containing_value(
     Optional[Tuple[int, int]]
         The interval that contains the value, or None if not found.
     """
-    intervals_array = np.array(intervals)
-    mask = (intervals_array[:, 0] <= value) & (value < intervals_array[:, 1])
-
-    
-    if np.any(mask):
-        return tuple(intervals_array[mask][0])
+    i = np.searchsorted(starts, value, side='right') - 1
+    if i >= 0 and value < ends[i]:
+        return int(starts[i]), int(ends[i])
     return None
 
 
@@ -461,11 +628,9 @@ def perform_jump(origin: int, cumulative_probabilities: np.ndarray) -> int:
     Returns:
         int: New position after jump.
     """
-    r = np.random.rand()
-    j = 0
-    while j < len(cumulative_probabilities) and r >= cumulative_probabilities[j]:
-        j += 1
-    return origin + j
+    r = RNG.random()
+    j = np.searchsorted(cumulative_probabilities, r, side='right')
+    return origin + int(j)
 
 
 def attempt_binding(alpha: float) -> bool:
@@ -478,7 +643,7 @@ def attempt_binding(alpha: float) -> bool:
     Returns:
         bool: True if binding succeeds, False otherwise.
     """
-    return np.random.rand() < alpha
+    return RNG.random() < alpha
 
 
 def attempt_unhooking(beta: float) -> bool:
@@ -491,7 +656,7 @@ def attempt_unhooking(beta: float) -> bool:
     Returns:
         bool: True if unhooking occurs, False otherwise.
     """
-    return np.random.rand() < beta
+    return RNG.random() < beta
 
 
 def decide_execution_order() -> bool:
@@ -501,7 +666,7 @@ def decide_execution_order() -> bool:
     Returns:
         bool: True if order 1 is chosen, False otherwise.
     """
-    return np.random.choice([1, 2]) == 1
+    return RNG.integers(1, 3) == 1
 
 
 def sample_gillespie_delay(rate_total: float) -> float:
@@ -514,16 +679,18 @@ def sample_gillespie_delay(rate_total: float) -> float:
     Returns:
         float: Sampled delay time.
     """
-    return -np.log(np.random.rand()) / rate_total
+    return -np.log(RNG.random()) / rate_total
 
 
-def folding(landscape:np.ndarray, first_origin:int) -> int:
+def folding(landscape: np.ndarray, first_origin: int, linker_bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> int:
     """
     Jumping on a random place around the origin, for the first position of the simulation.
 
     Args:
         landscape (np.ndarray): landscape with the minimum size for condensin to bind.
         origin (int): first point on which condensin arrives.
+        linker_bounds (tuple, optional): (starts, ends) of the linkers of the landscape, as returned by
+            find_block_bounds(landscape, 1). Computed if not given.
 
     Returns:
         int: The real origin of the simulation
@@ -531,37 +698,48 @@ def folding(landscape:np.ndarray, first_origin:int) -> int:
 
     # In order to test but normally we'll never begin any simulation on 0
     if first_origin == 0 :
-        true_origin = 0
+        return 0
 
-    else :
-        # Constant scenario : forcing the origin -> Might provoc a problem if alphaf and alphao are not 0 or 1 anymore !
-        if landscape[first_origin] != 1 and landscape[first_origin] != 0 :
-            true_origin = first_origin        
+    # Falling on a 0 : Refuted -> uniform position on the linker preceding the obstacle
+    if landscape[first_origin] == 0 :
+        if linker_bounds is None :
+            linker_bounds = find_block_bounds(landscape, 1)
+        starts, ends = linker_bounds
+        i = np.searchsorted(ends, first_origin, side='right') - 1
+        return int(RNG.integers(starts[i], ends[i]))
 
-        # Falling on a 1 : Validated
-        if landscape[first_origin] == 1 :
-            true_origin = first_origin
+    # Falling on a 1 : Validated
+    # Constant scenario : forcing the origin -> Might provoc a problem if alphaf and alphao are not 0 or 1 anymore !
+    return first_origin
 
-        # Falling on a 0 : Refuted
-        if landscape[first_origin] == 0 :
-            back_on_obstacle = 1
-            while landscape[first_origin-back_on_obstacle] != 1 :
-                back_on_obstacle += 1
-            pos = first_origin - back_on_obstacle
-            back_on_linker = 1
-            while landscape[pos-back_on_linker] != 0 :
-                back_on_linker += 1
-            true_origin = np.random.randint(first_origin-(back_on_obstacle+back_on_linker), first_origin-back_on_obstacle)+1
 
-    return(true_origin)
+@njit(cache=True, parallel=True)
+def bootstrap_slopes(slopes: np.ndarray, n_boot: int) -> np.ndarray:
+    """
+    Bootstrap the mean of per-trajectory slopes, one replicate per parallel iteration.
+
+    Args:
+        slopes (np.ndarray): Slope of each trajectory.
+        n_boot (int): Number of bootstrap samples.
+
+    Returns:
+        np.ndarray: Mean slope of each bootstrap sample.
+    """
+    nt = slopes.shape[0]
+    bootstrap_results = np.empty(n_boot)
+    for b in prange(n_boot):
+        total = 0.0
+        for _ in range(nt):
+            total += slopes[np.random.randint(0, nt)]
+        bootstrap_results[b] = total / nt
+    return bootstrap_results
 
 
 def compute_bootstrap_std(
     trajectories: list,
     nt: int,
     max_time: int,
-    n_boot: int = 10000,
-    batch_size: int = 100
+    n_boot: int = 10000
 ) -> float:
     """
     Perform bootstrapping to compute standard deviation of fitted slopes.
@@ -571,35 +749,159 @@ def compute_bootstrap_std(
         nt (int): Number of time steps per trajectory.
         max_time (int): Final time index for linear fitting.
         n_boot (int, optional): Number of bootstrap samples. Default is 10000.
-        batch_size (int, optional): Number of samples per batch. Default is 100.
 
     Returns:
         float: Standard deviation of the bootstrap results.
     """
-    np.random.seed()
     tab_array = np.array(trajectories)
-    bootstrap_results = np.empty(n_boot)
 
-    for i in range(0, n_boot, batch_size):
-        current_batch_size = min(batch_size, n_boot - i)
-        sample_indices = np.random.randint(0, nt, size=(current_batch_size, nt))
-        samples = tab_array[sample_indices]
-        means = np.mean(samples, axis=1)
-
-        bootstrap_results[i:i + current_batch_size] = [
-            linear_fit(values=mean, time_step=1, start_index=0, end_index=int(max_time))
-            for mean in means
-        ]
+    # The slope through the origin is linear in the data : slope(mean of samples) = mean of slopes(samples)
+    # So each trajectory is projected once and the bootstrap only averages these projections
+    values = tab_array[:nt, :int(max_time) + 1]
+    x = np.arange(values.shape[1], dtype=float)
+    slopes = values @ x / np.dot(x, x)
 
+    bootstrap_results = bootstrap_slopes(np.ascontiguousarray(slopes, dtype=np.float64), n_boot)
     result_std = np.std(bootstrap_results)
 
-    # Clean memory
-    del sample_indices, samples, bootstrap_results, means, tab_array
-    gc.collect()
-
     return result_std
 
 
+@njit(
+    types.int64(
+        readonly_f32_1d, types.float64, readonly_f64_1d_c, types.int64, types.int64, types.int64, types.int64,
+        types.float32[::1], types.float64[::1], types.int32[::1], types.float64[::1], types.float64[::1], types.float64[::1]
+    ),
+    cache=True, error_model='numpy'
+)
+def gillespie_one_trajectory(
+    alpha_row: np.ndarray,
+    beta: float,
+    p: np.ndarray,
+    l_max: int,
+    x_max: int,
+    x0: int,
+    origin: int,
+    results_row: np.ndarray,
+    t_row: np.ndarray,
+    x_row: np.ndarray,
+    e_time: np.ndarray,
+    u_jump: np.ndarray,
+    cum_rates: np.ndarray,
+) -> int:
+    """
+    Compiled reaction loop of the Gillespie algorithm for a single trajectory.
+
+    Args:
+        alpha_row (np.ndarray): Alpha values of the trajectory.
+        beta (float): Unhooking rate (same at every position).
+        p (np.ndarray): Jump probability array.
+        l_max (int): Maximum jump length.
+        x_max (int): Maximum x position (stopping condition).
+        x0 (int): Starting position (after folding).
+        origin (int): Origin used to shift the recorded positions.
+        results_row (np.ndarray): Row of the results matrix, filled in place.
+        t_row (np.ndarray): Buffer receiving the times of the trajectory.
+        x_row (np.ndarray): Buffer receiving the positions of the trajectory.
+        e_time (np.ndarray): Standard exponential draws (-log(u)) used for the reaction times (one per step).
+        u_jump (np.ndarray): Uniform draws used for the reaction choice (one per step).
+        cum_rates (np.ndarray): Scratch buffer of size l_max for the cumulative jump rates.
+
+    Returns:
+        int: Number of (t, x) couples written in the buffers.
+    """
+    t = 0.0
+    x = x0
+    i0 = 0
+    results_row[0] = 0.0  # initial time at x=0
+    t_row[0] = t
+    x_row[0] = x - origin
+    n_steps = 1
+    step = 0
+
+    while x < x_max:
+        # Cumulative jump rates from position x (cum_rates[k] : jumps of length 1 to k + 1) and total rate
+        n_jumps = l_max - 1 - x
+        rate_sum = 0.0
+        for k in range(n_jumps):
+            rate_sum += p[k + 1] * alpha_row[x + k + 1]
+            cum_rates[k] = rate_sum
+        r_tot = beta + rate_sum
+
+        # Sample next reaction time
+        t += e_time[step] / r_tot
+        if t > F32_MAX:
+            t = F32_MAX
+
+        # Unhooking test
+        r0 = u_jump[step]
+        step += 1
+        if r0 < beta / r_tot:
+            results_row[i0:min(x_max, x) + 1] = t
+            break
+
+        # Jump decision : shortest jump di such that (beta + cum_rates[di - 1]) / r_tot >= r0
+        # (jump starts at 1 as p[0] = 0 by design)
+        di = np.searchsorted(cum_rates[:n_jumps], r0 * r_tot - beta) + 1
+        di = min(di, n_jumps)
+
+        # Update position
+        x += di
+        t_row[n_steps] = t
+        x_row[n_steps] = x - origin
+        n_steps += 1
+
+        # Fill time array
+        results_row[i0:min(x_max, x) + 1] = t
+        i0 = x + 1
+
+    return n_steps
+
+
+@njit(cache=True, parallel=True)
+def gillespie_trajectories(
+    alpha_matrix: np.ndarray,
+    beta: float,
+    p: np.ndarray,
+    l_max: int,
+    x_max: int,
+    x0: np.ndarray,
+    origin: int,
+    results: np.ndarray,
+    t_block: np.ndarray,
+    x_block: np.ndarray,
+    lengths: np.ndarray,
+    e_time: np.ndarray,
+    u_jump: np.ndarray,
+    cum_rates: np.ndarray,
+) -> None:
+    """
+    Run gillespie_one_trajectory on a block of independent trajectories, in parallel.
+
+    Args:
+        alpha_matrix (np.ndarray): Alpha values, one row per trajectory of the block.
+        beta (float): Unhooking rate (same at every position).
+        p (np.ndarray): Jump probability array.
+        l_max (int): Maximum jump length.
+        x_max (int): Maximum x position (stopping condition).
+        x0 (np.ndarray): Starting position of each trajectory.
+        origin (int): Origin used to shift the recorded positions.
+        results (np.ndarray): Rows of the results matrix, filled in place.
+        t_block (np.ndarray): Buffers receiving the times, one row per trajectory.
+        x_block (np.ndarray): Buffers receiving the positions, one row per trajectory.
+        lengths (np.ndarray): Receives the number of (t, x) couples of each trajectory.
+        e_time (np.ndarray): Standard exponential draws for the reaction times, one row per trajectory.
+        u_jump (np.ndarray): Uniform draws for the reaction choices, one row per trajectory.
+        cum_rates (np.ndarray): Scratch buffers of size l_max, one row per thread.
+    """
+    for n_idx in prange(x0.shape[0]):
+        lengths[n_idx] = gillespie_one_trajectory(
+            alpha_matrix[n_idx], beta, p, l_max, x_max, x0[n_idx], origin,
+            results[n_idx], t_block[n_idx], x_block[n_idx], e_time[n_idx], u_jump[n_idx],
+            cum_rates[get_thread_id()]
+        )
+
+
 def gillespie_algorithm_in_position(
     lenght: int,
     l_max: int,
@@ -609,7 +911,8 @@ def gillespie_algorithm_in_position(
     p: np.ndarray,
     beta: float,
     nt: int,
-) -> tuple[np.ndarray, list, list, float]:
+    batch_size: int = 1024,
+) -> tuple[np.ndarray, pa.ListArray, pa.ListArray, float]:
     """
     Simulate a stochastic Gillespie algorithm with a custom reaction landscape over multiple trajectories.
 
@@ -622,78 +925,74 @@ def gillespie_algorithm_in_position(
         p (np.ndarray): Cumulative jump probability array.
         beta (float): Unhooking probability per position.
         nt (int): Number of independent trajectories to simulate.
+        batch_size (int, optional): Number of trajectories simulated in parallel at once. Defaults to 1024.
 
     Returns:
         tuple:
-            - results (np.ndarray): Matrix of shape (nt, x_max + 1), containing time values.
-            - all_t (list): List of time series for each trajectory.
-            - all_x (list): List of x position series for each trajectory.
+            - results (np.ndarray): Matrix of shape (nt, x_max + 1), containing time values (float32).
+            - all_t (pa.ListArray): Ragged array of the time series of each trajectory (float64).
+            - all_x (pa.ListArray): Ragged array of the x position series of each trajectory (int32).
             - t_max (float): Maximum time reached across all trajectories.
     """
 
     # --- Starting values --- #
 
-    beta_matrix = np.tile(np.full(lenght, beta), (nt, 1))
-    t_matrix = np.empty(nt, dtype=object)
-    x_matrix = np.empty(nt, dtype=object)
-    
-    # Main result matrix (time values per position)
-    results = np.full((nt, x_max + 1), np.nan, dtype=float)
-
-    # --- Loop on trajectories --- #
-    for n_idx in range(nt):
-        results[n_idx][0] = 0  # initial time at x=0
-
-        t = 0
-        i = 0
-        i0 = 0
-        x = folding(alpha_matrix[n_idx], origin)
-
-        t_series = [t]
-        x_series = [x - origin]
-
-        # --- Reaction loop --- #
-        while x < x_max:
-            # Total reaction rate at position x
-            r_tot = beta_matrix[n_idx][x] + np.nansum(
-                p[1:(l_max - x)] * alpha_matrix[n_idx][(x + 1):l_max]
-            )
-
-            # Sample next reaction time
-            t += -np.log(np.random.rand()) / r_tot
-            if np.isinf(t) == True:
-                t = 1e308
-
-            # Unhooking test
-            r0 = np.random.rand()
-            if r0 < beta_matrix[n_idx][x] / r_tot:
-                i = int(np.floor(x))
-                results[n_idx][i0:int(min(np.floor(x_max), i) + 1)] = t
-                break
-
-            # Jump decision
-            di = 1  # jump starts at 1 (p[0] = 0 by design)
-            rp = beta_matrix[n_idx][x] + p[di] * alpha_matrix[n_idx][x + di]
-
-            while (rp / r_tot) < r0 and (di < l_max - 1 - x):
-                di += 1
-                rp += p[di] * alpha_matrix[n_idx][x + di]
-
-            # Update position
-            x += di
-            t_series.append(t)
-            x_series.append(x - origin)
-
-            # Fill time array
-            i = int(np.floor(x)) if not np.isinf(x) else x_max
-            results[n_idx][i0:int(min(np.floor(x_max), i) + 1)] = t
-            i0 = i + 1
-
-        t_matrix[n_idx] = t_series
-        x_matrix[n_idx] = x_series
+    # Types expected by the compiled kernels (no copy if already right)
+    alpha_matrix = np.asarray(alpha_matrix, dtype=np.float32)
+    p = np.ascontiguousarray(p, dtype=np.float64)
+
+    # The rates are summed without any NaN handling
+    if not (np.isfinite(np.sum(p)) and np.isfinite(np.sum(alpha_matrix))):
+        raise ValueError("p and alpha_matrix must only contain finite values.")
+
+    # Main result matrix (time values per position) : times are accumulated in float64 but stored in float32
+    # (only averaged or binned afterwards, the differences between times are taken on the float64 series)
+    results = np.full((nt, x_max + 1), np.nan, dtype=np.float32)
+
+    # Each jump moves forward by at least one position : x_max + 1 couples (and draws) at most
+    # Buffers are allocated once and reused by every block of trajectories
+    n_max = x_max + 1
+    batch_size = min(batch_size, nt)
+    t_block = np.empty((batch_size, n_max), dtype=np.float64)     # float32 cannot resolve the steps at large t
+    x_block = np.empty((batch_size, n_max), dtype=np.int32)
+    e_time = np.empty((batch_size, n_max), dtype=np.float64)
+    u_jump = np.empty((batch_size, n_max), dtype=np.float64)
+    cum_rates = np.empty((get_num_threads(), l_max), dtype=np.float64)
+
+    # Trajectories are stored as ragged arrays : flat values + lengths
+    t_values, x_values = [], []
+    lengths = np.empty(nt, dtype=np.int32)
+
+    # Identical rows (broadcast landscape) : the linkers used by the folding are found once
+    linker_bounds = None
+    if alpha_matrix.strides[0] == 0 :
+        linker_bounds = find_block_bounds(alpha_matrix[0], 1)
+
+    # --- Loop on blocks of trajectories (parallel inside a block) --- #
+    for start in range(0, nt, batch_size):
+        stop = min(start + batch_size, nt)
+        size = stop - start
+        x0 = np.array([folding(alpha_matrix[n_idx], origin, linker_bounds) for n_idx in range(start, stop)], dtype=np.int64)
+        RNG.standard_exponential(out=e_time)
+        RNG.random(out=u_jump)
+
+        gillespie_trajectories(
+            alpha_matrix[start:stop], beta, p, l_max, x_max, x0, origin,
+            results[start:stop], t_block, x_block, lengths[start:stop], e_time, u_jump, cum_rates
+        )
+
+        # Keep the recorded part of each buffer row (row-major order : trajectories one after the other)
+        recorded = np.arange(n_max) < lengths[start:stop, np.newaxis]
+        t_values.append(t_block[:size][recorded])
+        x_values.append(x_block[:size][recorded])
+
+    offsets = pa.array(np.concatenate(([0], np.cumsum(lengths))).astype(np.int32))
+    t_values = np.concatenate(t_values)
+    t_matrix = pa.ListArray.from_arrays(offsets, pa.array(t_values))
+    x_matrix = pa.ListArray.from_arrays(offsets, pa.array(np.concatenate(x_values)))
 
     # Compute max time across all trajectories
-    t_max = np.floor(max(max(t_series) for t_series in t_matrix))
+    t_max = np.floor(np.max(t_values))
 
     return results, t_matrix, x_matrix, t_max
 
@@ -723,21 +1022,18 @@ def calculate_obs_and_linker_distribution(
             - points_l (np.ndarray): Centers of bins for linker lengths.
             - distrib_l (np.ndarray): Normalized distribution of linker lengths.
     """
-    # Masks for obstacles and linkers
-    mask_o = alpha_array == alphao
-    mask_l = alpha_array == alphaf
-
-    # Find lengths of obstacle sequences
-    diffs_o = np.diff(np.concatenate(([0], mask_o.astype(int), [0])))
-    starts_o = np.where(diffs_o == 1)[0]
-    ends_o = np.where(diffs_o == -1)[0]
-    counts_o = ends_o - starts_o
+    # Run-length encoding of the whole array in one pass : last index, length and value of each run
+    alpha_array = np.ascontiguousarray(alpha_array)
+    if alpha_array.size == 0:
+        run_ends, run_lengths = np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    else:
+        run_ends = np.append(np.nonzero(alpha_array[1:] != alpha_array[:-1])[0], alpha_array.size - 1)
+        run_lengths = np.diff(np.append(-1, run_ends))
+    run_values = alpha_array[run_ends]
 
-    # Find lengths of linker sequences
-    diffs_l = np.diff(np.concatenate(([0], mask_l.astype(int), [0])))
-    starts_l = np.where(diffs_l == 1)[0]
-    ends_l = np.where(diffs_l == -1)[0]
-    counts_l = ends_l - starts_l
+    # Lengths of obstacle and linker sequences
+    counts_o = run_lengths[run_values == alphao]
+    counts_l = run_lengths[run_values == alphaf]
 
     # Handle empty counts
     if counts_o.size == 0:
@@ -791,11 +1087,9 @@ def calculate_main_results_marcand(
     obs_profile = alpha_matrix[0, int(x_min):int(x_max)]
     obs_normalized = obs_profile / obs_profile.sum()
 
-    # 1. Mean first passage time across trajectories
-    fpt_mean = np.nanmean(results, axis=0)
-
-    # 2. 2D histogram of all FPTs (per column)
-    fpt_2D = hist_on_columns(results)
+    # 1. Mean first passage time across trajectories and 2. 2D histogram of all FPTs (per column), in one pass
+    # (bins of width 1e1 from 0 up to 1e4)
+    fpt_mean, fpt_2D = column_mean_and_histogram(results, 1e1, 1000)
 
     # 3. Histogram of first passage times at x_max
     fpt_xmax_distribution = fpt_2D[-1]
@@ -825,7 +1119,8 @@ def calculate_main_results_marcand(
 
     # 6. Delay: how much the obstacle slows things down
     # delay = fpt_mean - np.nanmean(results_wo, axis=0)
-    delay = fpt_mean - np.mean(v_th * np.arange(0, len(results[0]), 1), axis=0)
+    # (control without obstacle : fpt = v_th * x at each position)
+    delay = fpt_mean - np.float32(v_th) * np.arange(results.shape[1], dtype=np.float32)
 
     # -------------------- Optional plots -------------------- #
     if plot_results:
@@ -887,35 +1182,35 @@ def calculate_position_histogram(results: list, Lmax: int, origin: int, tmax: in
         - If no data exists for a time step, the corresponding histogram is filled with zeros.
     """
 
-    results_transposed = np.array(results).T                # Transpose the results to process positions at each time step
-    num_bins = np.arange(0, Lmax - (2 * origin) + 1, 1)     # Define the bins for the histogram
-    histograms = [None] * (tmax // time_step)               # Initialize the list for histograms
+    results_array = np.asarray(results, dtype=float)
+    n_bins = Lmax - (2 * origin)                            # Bins of width 1 from 0 to Lmax - 2 * origin
 
-    # Calculate the histogram for each time step
-    for t in range(0, tmax, time_step):
-        bin_counts, _ = np.histogram(results_transposed[t], bins=num_bins)
-        histograms[t] = bin_counts
+    # All time steps at once : (time index, position) couples binned in a single 2D histogram
+    results_steps = results_array[:, 0:tmax:time_step]
+    n_times = results_steps.shape[1]
+    positions = results_steps.ravel()                        # Row order : no transposition of the results
+    times = np.tile(np.arange(n_times), results_array.shape[0])
 
-    # Normalize the histograms to probabilities
-    histograms_list = [arr.tolist() for arr in histograms]
-    for t in range(0, tmax, time_step):
-        total_count = np.sum(histograms_list[t])
-        if total_count != 0:
-            histograms_list[t] = np.divide(histograms_list[t], total_count)
-        else:
-            histograms_list[t] = np.zeros_like(histograms_list[t])
+    if histogram2d is not None:
+        histograms = histogram2d(times, positions, bins=[n_times, n_bins], range=[[0, n_times], [0, n_bins]])
+    else:
+        inside = (positions >= 0) & (positions < n_bins)
+        flat_index = times[inside] * n_bins + positions[inside].astype(np.int64)
+        histograms = np.bincount(flat_index, minlength=n_times * n_bins).reshape(n_times, n_bins).astype(float)
 
-    # Convert the list of histograms to a NumPy array and transpose it
-    histograms_array = np.copy(histograms_list).T
+    # Normalize each time step in place (zeros if no data)
+    totals = histograms.sum(axis=1, keepdims=True)
+    np.divide(histograms, totals, out=histograms, where=totals > 0)
 
-    return histograms_array
+    # Rows correspond to bins, columns to time steps (transposed view, no copy)
+    return histograms.T
 
 
 def calculate_distrib_tbjs(matrix_t : np.ndarray, last_bin: float = 1e5):
     """Calculate the distribution of times between jumps : tbj
 
     Args:
-        matrix_t (list of lists): List of time steps for all trajectories.
+        matrix_t (pa.ListArray): Time steps for all trajectories.
         tmax (int): Maximum time value for the simulation.
 
 
@@ -925,27 +1220,57 @@ def calculate_distrib_tbjs(matrix_t : np.ndarray, last_bin: float = 1e5):
             - tbj_distribution (np.ndarray): Normalized histogram of times between jumps.
 
     Notes:
-        - The function computes time differences between consecutive jumps across all trajectories.
+        - The function computes time differences between consecutive jumps of each trajectory.
         - It returns a normalized histogram representing the distribution of these time differences.
         - If no data exists, the distribution is filled with zeros.
     """
-    # Define bins
-    tbj_bins = np.arange(0, last_bin + 1, 1)
+    n_bins = int(last_bin)                                     # Bins of width 1 from 0 to last_bin
 
-    # Flatten matrix_t and compute time differences
-    tbj_list = np.diff(np.concatenate(matrix_t))               # Differences between jumps
+    # Differences between jumps, within each trajectory only
+    t_all = matrix_t.flatten().to_numpy()
+    offsets = matrix_t.offsets.to_numpy()
+    same_trajectory = np.ones(max(t_all.size - 1, 0), dtype=bool)
+    same_trajectory[offsets[1:-1] - offsets[0] - 1] = False
+    tbj_list = np.diff(t_all)[same_trajectory]
 
-    # Create histogram
-    tbj_distrib, _ = np.histogram(tbj_list, bins=tbj_bins)     # Compute histogram
+    # Create histogram (last edge included, as in np.histogram)
+    if histogram1d is not None:
+        tbj_distrib = histogram1d(tbj_list, bins=n_bins, range=(0, n_bins))
+        tbj_distrib[-1] += np.count_nonzero(tbj_list == n_bins)
+    else:
+        inside = (tbj_list >= 0) & (tbj_list <= n_bins)
+        tbj_distrib = np.bincount(np.minimum(tbj_list[inside].astype(np.int64), n_bins - 1), minlength=n_bins)
 
     # Normalize the distribution
-    if np.sum(tbj_distrib) != 0:
-        tbj_distrib = tbj_distrib / np.sum(tbj_distrib)  
+    total = np.sum(tbj_distrib)
+    if total != 0:
+        tbj_distrib = tbj_distrib / total
     else:
-        tbj_distrib = np.zeros_like(tbj_distrib)
+        tbj_distrib = np.zeros(n_bins)
 
     # Return bin edges (excluding the last) and normalized distribution
-    return tbj_bins[:-1], tbj_distrib
+    return np.arange(n_bins), tbj_distrib
+
+
+@njit(
+    types.void(types.int64[::1], types.int64[::1], types.int64[::1], types.float32[:, ::1]),
+    cache=True, boundscheck=False
+)
+def scatter_intervals(time_index: np.ndarray, bin_start: np.ndarray, bin_end: np.ndarray, matrix: np.ndarray) -> None:
+    """
+    Write the difference array of the intervals [bin_start, bin_end) of each row time_index, in place.
+    Bins past the last column are clipped to it (the last column is a sentinel).
+
+    Args:
+        time_index (np.ndarray): Row of each interval.
+        bin_start (np.ndarray): First bin of each interval.
+        bin_end (np.ndarray): Bin after the last one of each interval.
+        matrix (np.ndarray): Difference array, cumulated along the columns by the caller.
+    """
+    last_column = matrix.shape[1] - 1
+    for k in range(time_index.shape[0]):
+        matrix[time_index[k], min(bin_start[k], last_column)] += 1
+        matrix[time_index[k], min(bin_end[k], last_column)] -= 1
 
 
 def calculate_fpt_matrix(matrix_t: np.ndarray, matrix_x: np.ndarray, tmax: int, t_bin: int, nt:int) -> tuple[np.ndarray, np.ndarray] :
@@ -954,8 +1279,8 @@ def calculate_fpt_matrix(matrix_t: np.ndarray, matrix_x: np.ndarray, tmax: int,
     Positions are grouped into bins of 'bin_size'.
 
     Args:
-        matrix_t (np.ndarray): All times.
-        matrix_x (np.ndarray): All positions.
+        matrix_t (pa.ListArray): All times.
+        matrix_x (pa.ListArray): All positions.
         tmax (int): Time maximum fixed.
         bin_size (int): Bin size of time.
         rf (int): Rounding Factor.
@@ -965,20 +1290,43 @@ def calculate_fpt_matrix(matrix_t: np.ndarray, matrix_x: np.ndarray, tmax: int,
             - fpt_results (np.ndarray): Matrix of density of first pass times.
             - fpt_number (np.ndarray): Number of trajectories that reached the positions.
     """
-    
-    x_max = int(np.max(np.concatenate(matrix_x)))
+    t_all = matrix_t.flatten().to_numpy()
+    x_all = matrix_x.flatten().to_numpy()
+    offsets = matrix_x.offsets.to_numpy()
+    offsets = offsets - offsets[0]
+
+    x_max = int(np.max(x_all))
     n_bins = int(np.ceil(x_max / t_bin))
-    fpt_matrix = np.zeros((int(tmax + 1), n_bins))
-    translated_all_x = [[x - sublist[0] for x in sublist] for sublist in matrix_x]
-
-    # I : matrix
-    couples = np.concatenate([list(zip(x, [min(np.floor(ti), tmax) for ti in t])) for x, t in zip(translated_all_x, matrix_t)])
-    for _ in range(len(couples)):
-        if couples[_][0] != 0:
-            time_index = int(couples[_][1])
-            bin_index_start = int(couples[_ - 1][0]) // t_bin
-            bin_index_end = int(couples[_][0]) // t_bin
-            fpt_matrix[time_index][bin_index_start:bin_index_end ] += 1
+
+    # Positions translated to the start of their own trajectory
+    lengths = np.diff(offsets)
+    translated_all_x = x_all - np.repeat(x_all[offsets[:-1]], lengths)
+
+    # Each jump (all couples but the first of each trajectory) covers the bins [start, end) at its time
+    jumps = np.ones(x_all.size, dtype=bool)
+    jumps[offsets[:-1]] = False
+    jumps &= translated_all_x != 0
+    jump_index = np.flatnonzero(jumps)
+    time_index = t_all[jump_index]                              # copy : floor and clip in place, one cast
+    np.floor(time_index, out=time_index)
+    np.minimum(time_index, tmax, out=time_index)
+    time_index = time_index.astype(np.int64)
+    bin_index = (translated_all_x // t_bin).astype(np.int64)    # one division for the starts and the ends
+    bin_index_end = bin_index[jump_index]
+    bin_index_start = bin_index[jump_index - 1]
+
+    # I : matrix (difference array : +1 at the start of each interval, -1 at its end, then cumulative sum)
+    # Bins past the last column go to it (sentinel column, dropped after the sum)
+    n_times = int(tmax + 1)
+    if histogram2d is not None:
+        bins, bounds = [n_times, n_bins + 1], [[0, n_times], [0, n_bins + 1]]
+        fpt_matrix = histogram2d(time_index, np.minimum(bin_index_start, n_bins), bins=bins, range=bounds).astype(np.float32)
+        fpt_matrix -= histogram2d(time_index, np.minimum(bin_index_end, n_bins), bins=bins, range=bounds)
+    else:
+        fpt_matrix = np.zeros((n_times, n_bins + 1), dtype=np.float32)    # counts stay exact in float32 (nt < 2**24)
+        scatter_intervals(time_index, bin_index_start, bin_index_end, fpt_matrix)
+    np.cumsum(fpt_matrix, axis=1, out=fpt_matrix)
+    fpt_matrix = fpt_matrix[:, :n_bins]
 
     # II : curve
     fpt_number = np.sum(fpt_matrix, axis=0)
@@ -1005,8 +1353,8 @@ def calculate_instantaneous_statistics(
     Calculate statistics for instantaneous speeds across multiple trajectories.
 
     Args:
-        matrix_t (np.ndarray): Times for all trajectories.
-        matrix_x (np.ndarray): Positions for all trajectories.
+        matrix_t (pa.ListArray): Times for all trajectories.
+        matrix_x (pa.ListArray): Positions for all trajectories.
         nt (int): Total number of trajectories.
         first_bin (float, optional): Lower bound for the histogram bins. Defaults to 0.
         last_bin (float, optional): Upper bound for the histogram bins. Defaults to 1e6.
@@ -1031,32 +1379,19 @@ def calculate_instantaneous_statistics(
             - v_mp (float): Most probable instantaneous speed.
     """
 
-    # Initialize arrays for displacements, time intervals, and speeds
-    dx_array = np.array([None] * nt, dtype=object)
-    dt_array = np.array([None] * nt, dtype=object)
-    vi_array = np.array([None] * nt, dtype=object)
-
-    # Loop through each trajectory
-    for i in range(nt):
-        x = np.array(matrix_x[i])
-        t = np.array(matrix_t[i])
-
-        # Calculate displacements (Δx) and time intervals (Δt)
-        dx = x[1:] - x[:-1]
-        dt = t[1:] - t[:-1]
-
-        # Calculate instantaneous speeds (Δx / Δt)
-        dv = dx / dt
+    t_all = matrix_t.flatten().to_numpy()
+    x_all = matrix_x.flatten().to_numpy().astype(np.int64)
+    offsets = matrix_t.offsets.to_numpy()
+    offsets = offsets - offsets[0]
 
-        # Store results in arrays
-        dx_array[i] = dx
-        dt_array[i] = dt
-        vi_array[i] = dv
+    # Consecutive couples of the same trajectory (differences across two trajectories are masked)
+    same_trajectory = np.ones(max(t_all.size - 1, 0), dtype=bool)
+    same_trajectory[offsets[1:-1] - 1] = False
 
-    # Concatenate arrays for all trajectories
-    dx_array = np.concatenate(dx_array)
-    dt_array = np.concatenate(dt_array)
-    vi_array = np.concatenate(vi_array)
+    # Calculate displacements (Δx), time intervals (Δt) and instantaneous speeds (Δx / Δt)
+    dx_array = np.diff(x_all)[same_trajectory]
+    dt_array = np.diff(t_all)[same_trajectory]
+    vi_array = dx_array / dt_array
 
     # Calculate distributions for Δx, Δt, and speeds
     dx_points, dx_distrib = calculate_distribution(dx_array, first_bin, last_bin, bin_width)
@@ -1159,6 +1494,29 @@ def prepare_value(value):
         raise ValueError(f"Unsupported data type: {type(value)}")
 
 
+def array_to_arrow(value: np.ndarray) -> pa.Array:
+    """
+    Convert a numeric NumPy array into a one-row (nested) Arrow list column, without going through Python lists.
+    NaNs become nulls, as with prepare_value.
+
+    Args:
+        value (np.ndarray): Numeric array of any dimension.
+
+    Returns:
+        pa.Array: Column of length 1 holding the array as (nested) lists.
+    """
+    flat = np.ascontiguousarray(value).ravel()
+    column = pa.array(flat, mask=np.isnan(flat) if flat.dtype.kind == 'f' else None)
+
+    # Wrap from the innermost dimension : each level groups the previous one by the size of its axis
+    for axis in range(value.ndim - 1, -1, -1):
+        n_lists = int(np.prod(value.shape[:axis]))
+        offsets = pa.array(np.arange(n_lists + 1, dtype=np.int32) * value.shape[axis])
+        column = pa.ListArray.from_arrays(offsets, column)
+
+    return column
+
+
 def writing_parquet(file:str, title: str, data_result: dict) -> None:
     """
     Write a dictionary directly into a Parquet file using PyArrow.
@@ -1191,13 +1549,34 @@ def writing_parquet(file:str, title: str, data_result: dict) -> None:
     # Define the Parquet file path
     data_file_name = os.path.join(title, f'{file}_{title}.parquet')
 
-    # Prepare the data for Parquet
-    prepared_data = {key: [prepare_value(value)] if not isinstance(value, list) else prepare_value(value)
-                     for key, value in data_result.items()}
+    # Prepare the data for Parquet (numeric arrays are converted by Arrow directly, with the SCHEMA type if the key is known)
+    prepared_data = {}
+    for key, value in data_result.items():
+        index = SCHEMA.get_field_index(key)
+        field_type = SCHEMA.field(index).type if index >= 0 else None
+        if isinstance(value, np.ndarray) and value.ndim > 0 and value.dtype.kind in 'biuf':
+            column = array_to_arrow(np.asarray(value))
+            prepared_data[key] = column.cast(field_type) if field_type is not None and column.type != field_type else column
+        elif isinstance(value, list):
+            prepared_data[key] = prepare_value(value)
+        elif field_type is not None:
+            try:
+                column = pa.array([value], from_pandas=True)                                # NaN -> null
+                prepared_data[key] = column.cast(field_type) if column.type != field_type else column
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                prepared_data[key] = [prepare_value(value)]                                 # Lossy cast : type inferred by Arrow
+        else:
+            prepared_data[key] = [prepare_value(value)]
 
     try:        
         table = pa.table(prepared_data)                                         # Create a PyArrow Table from the dictionary
-        pq.write_table(table, data_file_name, compression='gzip')               # Write the table to a Parquet file
+        pq.write_table(                                                         # Write the table to a Parquet file
+            table, data_file_name,
+            compression='zstd', compression_level=3,                            # Faster than gzip for a similar ratio on floats
+            use_dictionary=['alpha_choice'],                                    # Dictionary encoding only for the categorical metadata
+            data_page_size=1 << 20,
+            write_statistics=False,                                             # No min/max scan over the large float columns
+        )
 
     except Exception as e:
         print(f"Failed to write Parquet file due to: {e}")
@@ -1234,20 +1613,18 @@ def inspect_data_types(data: dict) -> None:
 # ================================================
 
 
-def sw_marcand(alpha_choice, gap, bpmin, alphaf, alphao, mu, theta, origin, nt, path):
-
+def sw_marcand(alpha_choice, gap, bpmin, alphaf, alphao, mu_theta_values, origin, nt, path):
+    """
+    Runs every (mu, theta) pair of mu_theta_values on the landscape defined by (alpha_choice, gap, bpmin).
+    The landscape and its distributions only depend on the latter, so they are built once per call.
+    """
 
     # --- Initialization --- #
 
-    # File
-    title = f'alphachoice={alpha_choice}_gap={int(gap)}_mu={int(mu)}_theta={int(theta)}_nt={nt}'
-    if not os.path.exists(title):
-        os.mkdir(title)
-
     # Constants 
     N = 8            # number of groups of 2 obstacles : 16 in total
     rap1_l = 14     # size in base pairs of rap1 obstacles
-    lacO_l = 24     # size in base pairs of lacO obstacles
+    lacO_l = 24     # size in base pairs of lacO obstacles
     bps = 1                                                                                      # based pair step 1 per 1
     c_bp = 3                                                                                         # depends on naked dna or chromatin : 3 for naked vs 25 for chromatin
     lp_dna = 100                                                                                     # persistence lenght
@@ -1255,7 +1632,7 @@ def sw_marcand(alpha_choice, gap, bpmin, alphaf, alphao, mu, theta, origin, nt,
     dt = 1                                                                                           # step of time
 
     
-    # Chromatin    
+    # Chromatin    
 
     # Input values for the all landscape
     l_min = 0                                   # first point of chromatin
@@ -1276,81 +1653,83 @@ def sw_marcand(alpha_choice, gap, bpmin, alphaf, alphao, mu, theta, origin, nt,
     L = np.arange(l_min, l_max, bps)        # All chromatin positions / Probability distribution on this interval
     total_lenght = len(L)
 
-    # Fixed analysis parameters
+    # Fixed analysis parameters
     bin_fpt = int(1)    # Bins on times during the all analysis
     tf = int(1000)      # Maximum times fixed in order to not map until 1e100
 
-    
-    # --- Simulation --- #
-
     # Landscape
     obs_points, obs_distrib, link_points, link_distrib = calculate_obs_and_linker_distribution(alpha_matrix[0], alphao, alphaf)
 
-    # Probabilities
-    p = proba_gamma(mu, theta, L)
+    for mu, theta in mu_theta_values:
 
-    # Modelling
-    results, t_matrix, x_matrix, tmax  = gillespie_algorithm_in_position(total_lenght, l_max, x_max, origin, alpha_matrix, p, beta, nt)
+        # File
+        title = f'alphachoice={alpha_choice}_gap={int(gap)}_mu={int(mu)}_theta={int(theta)}_nt={nt}'
+        if not os.path.exists(title):
+            os.mkdir(title)
 
-    # Results
-    fpt_mean, fpt_2D, fpt_x_max_distrib, p_tau, v_marcand, delay = calculate_main_results_marcand(results, alpha_matrix, x_max, x_min, mu)
 
-    # Times
-    fpt_distrib_2D, fpt_number = calculate_fpt_matrix(t_matrix, x_matrix, tmax=tf, t_bin=bin_fpt, nt=nt)
+        # --- Simulation --- #
 
-    # Waiting times
-    tbj_points, tbj_distrib = calculate_distrib_tbjs(t_matrix)
+        # Probabilities
+        p = proba_gamma(mu, theta, L)
 
-    # Speeds
-    dx_points, dx_distrib, dx_mean, dx_med, dx_mp, dt_points, dt_distrib, dt_mean, dt_med, dt_mp, vi_points, vi_distrib, vi_mean, vi_med, vi_mp = calculate_instantaneous_statistics(t_matrix, x_matrix, nt)
+        # Modelling
+        results, t_matrix, x_matrix, tmax  = gillespie_algorithm_in_position(total_lenght, l_max, x_max, origin, alpha_matrix, p, beta, nt)
 
+        # Results
+        fpt_mean, fpt_2D, fpt_x_max_distrib, p_tau, v_marcand, delay = calculate_main_results_marcand(results, alpha_matrix, x_max, x_min, mu)
 
-    # --- Writing --- #
+        # Times
+        fpt_distrib_2D, fpt_number = calculate_fpt_matrix(t_matrix, x_matrix, tmax=tf, t_bin=bin_fpt, nt=nt)
 
-    # First cleaning
-    del alpha_matrix, t_matrix, x_matrix
-    gc.collect()
+        # Waiting times
+        tbj_points, tbj_distrib = calculate_distrib_tbjs(t_matrix)
 
-    # Composing the main result that will be written
-    data_result = {
-        'alpha_choice': alpha_choice, 'gap':gap, 'bpmin':bpmin, 'mu':mu, 'theta':theta, 
-        'nt':nt, 'dt':dt, 'N':N, 
-        'alphao': alphao, 'alphaf': alphaf, 'beta': beta, 
-        'total_lenght':total_lenght, 'origin': origin, 'bps': bps,
+        # Speeds
+        dx_points, dx_distrib, dx_mean, dx_med, dx_mp, dt_points, dt_distrib, dt_mean, dt_med, dt_mp, vi_points, vi_distrib, vi_mean, vi_med, vi_mp = calculate_instantaneous_statistics(t_matrix, x_matrix, nt)
 
-        'alpha_mean': alpha_mean,
-        'obs_points':obs_points, 'obs_distrib':obs_distrib,
-        'link_points':link_points, 'link_distrib':link_distrib,
 
-        'p':p,
+        # --- Writing --- #
 
-        'results':results,
-        'fpt_mean':fpt_mean, 'fpt_2D':fpt_2D, 'fpt_x_max_distrib':fpt_x_max_distrib, 'p_tau':p_tau, 'v_marcand':v_marcand, 'delay':delay,
+        # First cleaning (plain arrays without reference cycles : del is enough, no gc.collect)
+        del t_matrix, x_matrix
 
-        'bin_fpt':bin_fpt, 'fpt_distrib_2D':fpt_distrib_2D, 'fpt_number':fpt_number,
+        # Composing the main result that will be written
+        data_result = {
+            'alpha_choice': alpha_choice, 'gap':gap, 'bpmin':bpmin, 'mu':mu, 'theta':theta, 
+            'nt':nt, 'dt':dt, 'N':N, 
+            'alphao': alphao, 'alphaf': alphaf, 'beta': beta, 
+            'total_lenght':total_lenght, 'origin': origin, 'bps': bps,
 
-        'tbj_points':tbj_points, 'tbj_distrib':tbj_distrib,
+            'alpha_mean': alpha_mean,
+            'obs_points':obs_points, 'obs_distrib':obs_distrib,
+            'link_points':link_points, 'link_distrib':link_distrib,
 
-        'dx_points':dx_points, 'dx_distrib':dx_distrib, 'dx_mean':dx_mean, 'dx_med':dx_med, 'dx_mp':dx_mp, 
-        'dt_points':dt_points, 'dt_distrib':dt_distrib, 'dt_mean':dt_mean, 'dt_med':dt_med, 'dt_mp':dt_mp, 
-        'vi_points':vi_points, 'vi_distrib':vi_distrib, 'vi_mean':vi_mean, 'vi_med':vi_med, 'vi_mp':vi_mp,
-    }
+            'p':p,
 
-    # # Types of data registered if needed
-    # inspect_data_types(data_result)
+            'results':results,
+            'fpt_mean':fpt_mean, 'fpt_2D':fpt_2D, 'fpt_x_max_distrib':fpt_x_max_distrib, 'p_tau':p_tau, 'v_marcand':v_marcand, 'delay':delay,
 
-    # Writing event
-    writing_parquet(path, title, data_result)
+            'bin_fpt':bin_fpt, 'fpt_distrib_2D':fpt_distrib_2D, 'fpt_number':fpt_number,
 
-    # Second cleaning
-    for key in list(data_result.keys()):
-        del data_result[key]
-        if key in locals():
-            del locals()[key]
-    del data_result 
-    gc.collect()
+            'tbj_points':tbj_points, 'tbj_distrib':tbj_distrib,
+
+            'dx_points':dx_points, 'dx_distrib':dx_distrib, 'dx_mean':dx_mean, 'dx_med':dx_med, 'dx_mp':dx_mp, 
+            'dt_points':dt_points, 'dt_distrib':dt_distrib, 'dt_mean':dt_mean, 'dt_med':dt_med, 'dt_mp':dt_mp, 
+            'vi_points':vi_points, 'vi_distrib':vi_distrib, 'vi_mean':vi_mean, 'vi_med':vi_med, 'vi_mp':vi_mp,
+        }
+
+        # # Types of data registered if needed
+        # inspect_data_types(data_result)
+
+        # Writing event
+        writing_parquet(path, title, data_result)
+
+        # Second cleaning
+        del data_result, results, fpt_2D, fpt_distrib_2D
 
     # Done
+    del alpha_matrix
     return None
 
 
@@ -1399,11 +1778,11 @@ def choose_configuration(config: str):
 
 def process_function(params):
     """
-    Defines one process
+    Defines one process : one landscape and all the (mu, theta) pairs attached to it
     """
-    alpha_choice, gap, bpmin, mu, theta, alphaf, alphao, nt, path,  = params
+    alpha_choice, gap, bpmin, mu_theta_values, alphaf, alphao, nt, path,  = params
     # logging.debug(f'Processing : s={s}, l={l}, bp_min={bp_min}, alpha_choice={alpha_choice}, k={k}, theta={theta}')
-    sw_marcand(alpha_choice, gap, bpmin, alphaf, alphao, mu, theta, origin, nt, path)
+    sw_marcand(alpha_choice, gap, bpmin, alphaf, alphao, mu_theta_values, origin, nt, path)
     return None
 
 
@@ -1412,16 +1791,21 @@ def execute_in_parallel(config: str, execution_mode: str) -> None:
     Launches all the process
     """
     # Inputs
-    alpha_choice_values, bpmin_values, gap_values, mu_values, theta_values, alphaf, alphao, nt, path  = choose_configuration(config)
+    alpha_choice_values, gap_values, bpmin_values, mu_values, theta_values, alphaf, alphao, nt, path  = choose_configuration(config)
     
-    #- Inputs
-    params_list = [
-        (alpha_choice, bp_min, gap, mu, theta, alphaf, alphao, nt, path,)
+    #- Inputs : one unit per landscape, the (mu, theta) pairs are split so that every worker gets some
+    landscapes = [
+        (alpha_choice, gap, bp_min)
         for alpha_choice in alpha_choice_values
-        for bp_min in bpmin_values
         for gap in gap_values
-        for mu in mu_values
-        for theta in theta_values
+        for bp_min in bpmin_values
+    ]
+    mu_theta_values = [(mu, theta) for mu in mu_values for theta in theta_values]
+    num_splits = min(len(mu_theta_values), max(1, -(-num_tasks * num_cores_used // len(landscapes))))
+    params_list = [
+        (alpha_choice, gap, bp_min, mu_theta_chunk, alphaf, alphao, nt, path,)
+        for alpha_choice, gap, bp_min in landscapes
+        for mu_theta_chunk in np.array_split(np.array(mu_theta_values), num_splits)
     ]
     
     #- Chunks
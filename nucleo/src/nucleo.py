@@ -9,34 +9,72 @@
 
 # 1.1 : Standard library imports
 import os
-import gc
 import time
 import math
 import logging
-from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from itertools import groupby
+from functools import lru_cache, partial
+from itertools import groupby, islice, product
+from statistics import fmean
 from collections import Counter
 from typing import Callable, Tuple, List, Dict, Optional
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import get_context
 from tqdm import tqdm
 
 
 # 1.2 Third-party library imports
 import numpy as np
+from numba import njit, prange, get_num_threads, get_thread_id, types, vectorize
 from scipy.stats import gamma
-from scipy.stats import linregress
 from scipy.optimize import curve_fit
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+# Optional : faster histograms on uniform bins
+try:
+    from fast_histogram import histogram1d
+except ImportError:
+    histogram1d = None
+
 
 # 1.3 Matplotlib if required
 import matplotlib.pyplot as plt
 import matplotlib.cm as cm
 
 
+# 1.4 Numba types of the read-only inputs (accept writable arrays and broadcast views)
+readonly_f32_1d = types.Array(types.float32, 1, 'A', readonly=True)
+readonly_f32_1d_c = types.Array(types.float32, 1, 'C', readonly=True)
+readonly_f32_2d = types.Array(types.float32, 2, 'A', readonly=True)
+readonly_f64_1d = types.Array(types.float64, 1, 'A', readonly=True)
+readonly_f64_1d_c = types.Array(types.float64, 1, 'C', readonly=True)
+readonly_i64_1d_c = types.Array(types.int64, 1, 'C', readonly=True)
+
+
+# 1.5 Pool of uniform draws for the scalar random helpers (reseeded and emptied in forked workers so that they do not share draws)
+def random_pool(size: int = 65536):
+    """
+    Yield uniform draws in [0, 1), generated by batches of `size` with np.random.random.
+    """
+    while True:
+        yield from np.random.random(size).tolist()
+
+
+def reset_random_pool() -> None:
+    """
+    Reseed np.random from the OS entropy and replace the module pool by an empty one.
+    """
+    global RANDOM_POOL
+    np.random.seed()
+    RANDOM_POOL = random_pool()
+
+
+RANDOM_POOL = random_pool()
+os.register_at_fork(after_in_child=reset_random_pool)
+
+
 # ================================================
 # Part 2.1 : General functions
 # ================================================
@@ -57,17 +95,8 @@ def add_dicts(dict1: Dict, dict2: Dict) -> Dict:
         dict: A new dictionary with keys from both dictionaries, 
               where the values are the sum of the values from dict1 and dict2.
     """
-    merged_dict = defaultdict(int)
-
-    # Add values from dict1 to merged_dict
-    for key, value in dict1.items():
-        merged_dict[key] += value
-
-    # Add values from dict2 to merged_dict
-    for key, value in dict2.items():
-        merged_dict[key] += value
-
-    return dict(merged_dict)
+    # Keys of dict1 then new keys of dict2 (Counter addition would drop non-positive sums)
+    return {key: dict1.get(key, 0) + dict2.get(key, 0) for key in {**dict1, **dict2}}
 
 
 def compute_mean_from_dict(input_dict: dict) -> dict:
@@ -84,7 +113,7 @@ def compute_mean_from_dict(input_dict: dict) -> dict:
     mean_dict = {}
     for key, values in input_dict.items():
         if isinstance(values, list):
-            mean_dict[key] = np.mean(np.array(values))
+            mean_dict[key] = fmean(values) if values else np.nan
     return mean_dict
 
 
@@ -116,22 +145,54 @@ def calculate_distribution(
     if data.size == 0: 
         return np.array([]), np.array([])
 
-    # Points and not bins
-    bins_array = np.arange(first_bin, int(last_bin) + bin_width, bin_width)
-    distrib, bins_edges = np.histogram(data, bins=bins_array)
+    # Uniform bins : same edges as np.arange(first_bin, int(last_bin) + bin_width, bin_width), without building them
+    n_bins = math.ceil((int(last_bin) + bin_width - first_bin) / bin_width) - 1
+
+    upper_bin = first_bin + n_bins * bin_width
 
-    # Normalizing without generating NaNs
-    if np.sum(distrib) > 0:
-        distrib = distrib / np.sum(distrib)
+    # Single pass over the data : NaNs and values out of the range are dropped, last edge included
+    data = np.asarray(data, dtype=np.float64).ravel()
+    if histogram1d is not None:
+        distrib = histogram1d(data, bins=n_bins, range=(first_bin, upper_bin))
+        distrib[-1] += np.count_nonzero(data == upper_bin)
     else:
-        distrib = np.zeros_like(distrib)
+        distrib = uniform_histogram(data, first_bin, 1.0 / bin_width, n_bins)
 
-    points = (bins_edges[:-1] + bins_edges[1:]) / 2
+    # Normalizing in place without generating NaNs (counts are non-negative : a zero total means all zeros)
+    total = distrib.sum()
+    if total > 0:
+        distrib /= total
+
+    # Points and not bins
+    points = first_bin + (np.arange(n_bins) + 0.5) * bin_width
 
     # Return the bin centers and the normalized distribution
     return points, distrib
 
 
+@njit(types.float64[::1](readonly_f64_1d, types.float64, types.float64, types.int64), cache=True, nogil=True)
+def uniform_histogram(data: np.ndarray, first_bin: float, inv_width: float, n_bins: int) -> np.ndarray:
+    """
+    Count the data in n_bins uniform bins starting at first_bin, in a single pass.
+    NaNs and values out of the range are ignored, the last edge is included (as in np.histogram).
+
+    Args:
+        data (np.ndarray): Values to count.
+        first_bin (float): Lower bound of the first bin.
+        inv_width (float): Inverse of the width of the bins.
+        n_bins (int): Number of bins.
+
+    Returns:
+        np.ndarray: Counts of each bin.
+    """
+    counts = np.zeros(n_bins)
+    for value in data:
+        scaled = (value - first_bin) * inv_width
+        if 0 <= scaled <= n_bins:
+            counts[min(int(scaled), n_bins - 1)] += 1
+    return counts
+
+
 def linear_fit(array: np.ndarray, step: float) -> float:
     """
     Calculate the slope of a linear regression constrained to pass through the origin (0, 0),
@@ -151,12 +212,11 @@ def linear_fit(array: np.ndarray, step: float) -> float:
     if len(valid_array) < 2:
         return np.nan
 
-    x = np.arange(0, len(array)) * step
+    x = np.arange(0, len(array), dtype=np.float64) * step
     x = x[valid_mask]
-    x = x[:, np.newaxis]
 
-    slope, _, _, _ = np.linalg.lstsq(x, valid_array, rcond=None)
-    return slope[0]
+    # Least squares through the origin : closed form, no SVD
+    return np.dot(x, valid_array) / np.dot(x, x)
 
 
 # ================================================
@@ -164,6 +224,7 @@ def linear_fit(array: np.ndarray, step: float) -> float:
 # ================================================
 
 
+@vectorize(['float64(float64, float64, float64)'], fastmath=True, cache=True)
 def proba_tataki(R: float, L: float, lp: float) -> float:
     """
     Compute the probability density function (PDF) for a given model.
@@ -193,13 +254,14 @@ def proba_tataki(R: float, L: float, lp: float) -> float:
     A = 1
 
     # Compute the probability density function
-    PLR = A * ((4 * math.pi * N) * ((R / L) ** 2)) / (L * ((1 - (R / L) ** 2)) ** (9 / 2)) \
-          * np.exp(alpha - (3 * t) / (4 * (1 - (R / L) ** 2)))
+    ratio_squared = (R / L) ** 2
+    PLR = A * ((4 * math.pi * N) * ratio_squared) / (L * (1 - ratio_squared) ** (9 / 2)) \
+          * math.exp(alpha - (3 * t) / (4 * (1 - ratio_squared)))
 
     return PLR
 
 
-def proba_gamma(mu: float, theta: float, L: float) -> float:
+def proba_gamma(mu: float, theta: float, L: float, normalize: bool = True) -> float:
     """
     Compute the probability density function (PDF) of a Gamma distribution.
 
@@ -207,17 +269,91 @@ def proba_gamma(mu: float, theta: float, L: float) -> float:
         mu (float): Mean of the Gamma distribution.
         theta (float): Standard deviation of the Gamma distribution.
         L (float): Value at which to evaluate the probability density.
+        normalize (bool): If True, rescale the values so that they sum to 1 over L (discrete pmf on the grid).
 
     Returns:
         float: Probability density at the given value L for the Gamma distribution.
     """
-    alpha_gamma = mu**2 / theta**2                              # Calculate the shape parameter (alpha) of the Gamma distribution
-    beta_gamma = theta**2 / mu                                  # Calculate the scale parameter (beta) of the Gamma distribution
-    p_gamma = gamma.pdf(L, a=alpha_gamma, scale=beta_gamma)     # Compute the probability density for the value L
+    return make_proba_gamma(mu, theta)(L, normalize)
+
+
+@lru_cache(maxsize=32)
+def make_proba_tataki(L: float, lp: float) -> Callable:
+    """
+    Specialize proba_tataki on (L, lp) : the constants are computed once, only R varies.
+
+    Args:
+        L (float): Characteristic length scale of the system.
+        lp (float): Persistence length of the system.
+
+    Returns:
+        Callable: Function of R giving the same values as proba_tataki(R, L, lp).
+    """
+    # Compute auxiliary parameters
+    t = (3 * L) / (2 * lp)
+    alpha = (3 * t) / 4
 
-    p_gamma = p_gamma / np.sum(p_gamma)
+    # Compute the normalization factor (N) and the constant factors of the PDF
+    N = (4 * (alpha ** (3 / 2))) / (((math.pi) ** (3 / 2)) * (4 + (12 * alpha ** (-1)) + 15 * (alpha ** (-2))))
+    scale = (4 * math.pi * N) / L
+    decay = (3 * t) / 4
+
+    def proba(R):
+        ratio_squared = (np.asarray(R, dtype=np.float64) / L) ** 2
+        return scale * ratio_squared / (1 - ratio_squared) ** (9 / 2) * np.exp(alpha - decay / (1 - ratio_squared))
+
+    return proba
 
-    return p_gamma
+
+@lru_cache(maxsize=32)
+def make_proba_gamma(mu: float, theta: float) -> Callable:
+    """
+    Specialize proba_gamma on (mu, theta) : the Gamma distribution is frozen once, only L varies.
+
+    Args:
+        mu (float): Mean of the Gamma distribution.
+        theta (float): Standard deviation of the Gamma distribution.
+
+    Returns:
+        Callable: Function of (L, normalize=True) giving the same values as proba_gamma(mu, theta, L, normalize).
+    """
+    alpha_gamma = mu**2 / theta**2                                  # Calculate the shape parameter (alpha) of the Gamma distribution
+    beta_gamma = theta**2 / mu                                      # Calculate the scale parameter (beta) of the Gamma distribution
+    frozen_gamma = gamma(a=alpha_gamma, scale=beta_gamma)
+
+    def proba(L, normalize=True):
+        log_p_gamma = frozen_gamma.logpdf(L)                        # Compute the log probability density for the value L
+
+        if not normalize:
+            return np.exp(log_p_gamma)
+
+        # Shifting by the maximum before exponentiating keeps the pmf finite when the densities underflow
+        p_gamma = np.exp(log_p_gamma - np.max(log_p_gamma))
+        p_gamma /= np.sum(p_gamma)
+
+        return p_gamma
+
+    return proba
+
+
+@lru_cache(maxsize=128)
+def proba_gamma_on_grid(mu: float, theta: float, Lmin: int, Lmax: int, bps: int) -> np.ndarray:
+    """
+    Normalized proba_gamma on the chromatin grid np.arange(Lmin, Lmax, bps), computed once per parameter set of the sweep.
+
+    Args:
+        mu (float): Mean of the Gamma distribution.
+        theta (float): Standard deviation of the Gamma distribution.
+        Lmin (int): First point of chromatin.
+        Lmax (int): Last point of chromatin.
+        bps (int): Number of base pairs per site.
+
+    Returns:
+        np.ndarray: Read-only probabilities of the jumps (shared between calls).
+    """
+    p = proba_gamma(mu, theta, np.arange(Lmin, Lmax, bps))
+    p.flags.writeable = False
+    return p
 
 
 # ================================================
@@ -244,7 +380,7 @@ def alpha_random(s:int, l:int, alphao:float, alphaf:float, L_min:int, Lmax:int,
     """
     np.random.seed()
 
-    alpha_array = np.full(int((Lmax-L_min)/bps), alphaf)    # creates a NumPy array of length Lmax filled with the value alphaf
+    alpha_array = np.full(int((Lmax-L_min)/bps), alphaf, dtype=np.float32)    # creates a NumPy array of length Lmax filled with the value alphaf
     T = int(Lmax / (l + s))                                 # how many blocks of size l + s can fit into the total length Lmax ; represents how many obstacle blocks can be inserted into the list
     max_pos = Lmax - (T * s)                                # determines the maximum possible position for obstacle blocks, taking into account the fact that each block occupies s positions 
 
@@ -253,13 +389,35 @@ def alpha_random(s:int, l:int, alphao:float, alphaf:float, L_min:int, Lmax:int,
     alpha_random_sorted = np.sort(alpha_random)                 # sorts random positions to avoid overlapping and ensure orderly placement of obstacle blocks
     alpha_random_modified = alpha_random_sorted + np.arange(len(alpha_random_sorted)) * (s)     # each point is shifted ([2 + 0, 3 + s, 6 + 2*s ....] etc) to prevent overlapping
     
-    # filling with obstacles
-    for pos in alpha_random_modified:
-        alpha_array[pos:pos + s] = alphao                                                       # for each position modified in _alpha_random_modified_, place an obstacle block (alphao) of length s in the _alpha_array
+    # filling with obstacles : every site of every block (alphao) of length s at once, past the end of _alpha_array_ dropped
+    place_obstacles(alpha_array[np.newaxis, :], alpha_random_modified[np.newaxis, :], s, alphao)
 
     return alpha_array
 
 
+def place_obstacles(alpha_matrix: np.ndarray, positions: np.ndarray, s: int, alphao: float) -> None:
+    """
+    Write alphao on the s sites starting at each position, for every row of a C-contiguous matrix, in place.
+    One scatter of flat indices per block of rows (bounded memory for the indices), sites past the end of a row are dropped.
+
+    Args:
+        alpha_matrix (np.ndarray): Landscapes modified in place, one per row.
+        positions (np.ndarray): First site of each obstacle, one row of positions per landscape.
+        s (int): Value of s, nucleosome size.
+        alphao (float): Probability of beeing accepted on nucleosome sites.
+    """
+    nt, size = alpha_matrix.shape
+    flat_matrix = alpha_matrix.reshape(-1)
+    obstacle_offsets = np.arange(s)                                     # Same offsets for every block of rows
+    overflow = positions.size > 0 and positions.max() + s > size        # Masking only if some sites can fall past the end
+    block = max(1, 2**22 // max(positions.shape[1] * s, 1))
+    for start in range(0, nt, block):
+        stop = min(start + block, nt)
+        sites = positions[start:stop, :, np.newaxis] + obstacle_offsets
+        flat_sites = sites + (np.arange(start, stop) * size)[:, np.newaxis, np.newaxis]
+        flat_matrix[flat_sites[sites < size] if overflow else flat_sites.ravel()] = alphao
+
+
 def alpha_periodic(s:int, l:int, alphao:float, alphaf:float, Lmin:int, Lmax:int, bps:int) -> np.ndarray:
     """Generates one periodic pattern
 
@@ -278,8 +436,10 @@ def alpha_periodic(s:int, l:int, alphao:float, alphaf:float, Lmin:int, Lmax:int,
 
     N = int(int((Lmax-Lmin)/bps) // (l + s))
     residue = Lmax - N * (l + s)
-    pattern = np.concatenate((np.full(l, alphaf), np.full(s, alphao)))
-    alpha_array = np.concatenate((np.tile(pattern, N), np.full(residue, alphaf)))
+
+    # One allocation : N patterns (l linker sites then s nucleosome sites) followed by the residue of linker sites
+    alpha_array = np.full(N * (l + s) + residue, alphaf, dtype=np.float32)
+    alpha_array[:N * (l + s)].reshape(N, l + s)[:, l:] = alphao
     
     return alpha_array
 
@@ -302,7 +462,7 @@ def alpha_constant(s:int, l:int, alphao:float, alphaf:float, Lmin:int, Lmax:int,
 
     value = (alphao * s + alphaf * l) / (l + s)
     size = int((Lmax - Lmin) / bps)
-    alpha_array = np.full(size, value)
+    alpha_array = np.full(size, value, dtype=np.float32)
 
     return alpha_array
 
@@ -328,7 +488,7 @@ def alpha_matrix_calculation(alpha_choice:str, s:int, l:int, bpmin:int, alphao:f
         ValueError: In case the choice is not aligned with the possibilities
 
     Returns:
-        np.ndarray: Matrix of each landscape corresponding to a trajectory
+        np.ndarray: Matrix of each landscape corresponding to a trajectory (read-only view when all rows are identical)
     """
 
     alpha_functions = {'periodic', 'one_random', 'ntrandom', 'constantmean'}
@@ -338,24 +498,36 @@ def alpha_matrix_calculation(alpha_choice:str, s:int, l:int, bpmin:int, alphao:f
     
     elif alpha_choice == 'periodic' :
         alpha_array = alpha_periodic(s, l, alphao, alphaf, Lmin, Lmax, bps)
-        alpha_matrix = np.tile(alpha_array, (nt,1))
 
     elif alpha_choice == 'one_random' :
         alpha_array = alpha_random(s, l, alphao, alphaf, Lmin, Lmax, bps)
-        alpha_matrix = np.tile(alpha_array, (nt,1))
     
     elif alpha_choice == 'constantmean' :
         alpha_array = alpha_constant(s, l, alphao, alphaf, Lmin, Lmax, bps)
-        alpha_matrix = np.tile(alpha_array, (nt,1))
 
     elif alpha_choice == 'ntrandom':
-        alpha_matrix = np.empty((nt, int((Lmax - Lmin) / bps)))
-        for i in range(nt):
-            alpha_matrix[i] = alpha_random(s, l, alphao, alphaf, Lmin, Lmax, bps)
-
-    # Values
-    alpha_matrix = np.array([binding_length(alpha, alphao, alphaf, bpmin) for alpha in alpha_matrix], dtype=float)
-    mean_alpha = np.mean(alpha_matrix, axis=0)
+        # Same rules as alpha_random, for all the trajectories at once and with a single generator
+        size = int((Lmax - Lmin) / bps)
+        T = int(Lmax / (l + s))
+        max_pos = Lmax - (T * s)
+        rng = np.random.default_rng()
+        positions = np.sort(rng.integers(0, max_pos + 1, size=(nt, T)), axis=1) + np.arange(T) * s
+
+        # Filling with obstacles, as in alpha_random
+        alpha_matrix = np.full((nt, size), alphaf, dtype=np.float32)
+        place_obstacles(alpha_matrix, positions, s, alphao)
+
+        # Values : short linkers removed on every trajectory in parallel (the matrix is a fresh array, modified in place)
+        value_type = alpha_matrix.dtype.type
+        replace_short_runs_in_rows(alpha_matrix, value_type(alphao), value_type(alphaf), bpmin)
+        mean_alpha = np.mean(alpha_matrix, axis=0, dtype=np.float64)     # float32 landscapes, float64 accumulation
+
+    if alpha_choice != 'ntrandom':
+        # Identical rows : short linkers removed once, then a read-only view repeating the landscape (no copy)
+        value_type = alpha_array.dtype.type
+        replace_short_runs(alpha_array, value_type(alphao), value_type(alphaf), bpmin)
+        alpha_matrix = np.broadcast_to(alpha_array, (nt, alpha_array.size))
+        mean_alpha = alpha_array.astype(np.float64)
     
     return alpha_matrix, mean_alpha
 
@@ -394,23 +566,58 @@ def binding_length(alpha_list: np.ndarray, alphao: float, alphaf: float, bpmin:
     >>> binding_length(alpha_list, alphao, alphaf, bpmin)
     array([0, 0, 1, 1, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0])
     """
-    alpha_array = alpha_list.copy()     # Avoid modifying the original input array
-    mask = alpha_array == alphaf        # Identify indices where the values are equal to `alphaf`
-
-    # Find start and end indices of consecutive sequences of `alphaf`
-    diffs = np.diff(np.concatenate(([0], mask.astype(int), [0])))
-    starts = np.where(diffs == 1)[0]    # Start of sequences
-    ends = np.where(diffs == -1)[0]     # End of sequences
+    alpha_array = np.array(alpha_list)  # Avoid modifying the original input array
 
-    # Iterate over sequences and replace if the length is less than `bpmin`
-    for start, end in zip(starts, ends):
-        length = end - start
-        if length < bpmin:
-            alpha_array[start:end] = alphao
+    # Values cast to the type of the array, so that the comparisons are made as in NumPy
+    value_type = alpha_array.dtype.type
+    replace_short_runs(alpha_array, value_type(alphao), value_type(alphaf), bpmin)
 
     return alpha_array
 
 
+@njit(cache=True)
+def replace_short_runs(alpha_array: np.ndarray, alphao: float, alphaf: float, bpmin: int) -> None:
+    """
+    Compiled core of binding_length : a single scan of the array, in place.
+    Each sequence of consecutive `alphaf` shorter than `bpmin` is replaced by `alphao`.
+
+    Args:
+        alpha_array (np.ndarray): Array modified in place.
+        alphao (float): Replacement value.
+        alphaf (float): Value of the sequences of interest.
+        bpmin (int): Minimum length of a sequence to remain unchanged.
+    """
+    n = alpha_array.shape[0]
+    i = 0
+    while i < n:
+        if alpha_array[i] == alphaf:
+            j = i
+            while j < n and alpha_array[j] == alphaf:
+                j += 1
+            # Short run overwritten while still in cache, element by element (no slice view per run)
+            if j - i < bpmin:
+                for k in range(i, j):
+                    alpha_array[k] = alphao
+            i = j
+        else:
+            i += 1
+
+
+@njit(cache=True, parallel=True)
+def replace_short_runs_in_rows(alpha_matrix: np.ndarray, alphao: float, alphaf: float, bpmin: int) -> None:
+    """
+    Apply replace_short_runs to every row of a matrix, in place and in parallel (rows are independent).
+
+    Args:
+        alpha_matrix (np.ndarray): Matrix modified in place, one landscape per row.
+        alphao (float): Replacement value.
+        alphaf (float): Value of the sequences of interest.
+        bpmin (int): Minimum length of a sequence to remain unchanged.
+    """
+    for i in prange(alpha_matrix.shape[0]):
+        replace_short_runs(alpha_matrix[i], alphao, alphaf, bpmin)
+
+
 def find_blocks(array: np.ndarray, alpha_value: float) -> List[Tuple[int, int]]:
     """
     Identify contiguous regions in the array where values are equal (or close) to a given value.
@@ -429,45 +636,94 @@ def find_blocks(array: np.ndarray, alpha_value: float) -> List[Tuple[int, int]]:
     List[Tuple[int, int]]
         A list of intervals (start_index, end_index) for each contiguous obstacle block.
     """
-    array = np.asarray(array)
-    is_block = np.isclose(array, alpha_value, atol=1e-8)
-    diff = np.diff(is_block.astype(int))
-    starts = np.where(diff == 1)[0] + 1
-    ends = np.where(diff == -1)[0] + 1
+    starts, ends = find_block_bounds(np.asarray(array), alpha_value)
+    return list(zip(starts, ends))
 
-    if is_block[0]:
-        starts = np.insert(starts, 0, 0)
-    if is_block[-1]:
-        ends = np.append(ends, len(array))
 
-    return list(zip(starts, ends))
+@njit(cache=True)
+def find_block_bounds(array: np.ndarray, alpha_value: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compiled core of find_blocks : a single scan of the array, without intermediate masks.
+    Values are compared as np.isclose(array, alpha_value, atol=1e-8) does.
+
+    Args:
+        array (np.ndarray): The array representing the full environment.
+        alpha_value (float): The value of the blocks.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Start indices and end indices (exclusive) of the blocks.
+    """
+    n = array.shape[0]
+    tolerance = 1e-8 + 1e-5 * abs(alpha_value)
+    starts = np.empty(n // 2 + 1, dtype=np.int64)
+    ends = np.empty(n // 2 + 1, dtype=np.int64)
+    k = 0
+    start = 0
+    in_block = False
+    for i in range(n):
+        is_block = abs(array[i] - alpha_value) <= tolerance
+        if is_block and not in_block:
+            start = i
+            in_block = True
+        elif not is_block and in_block:
+            starts[k] = start
+            ends[k] = i
+            k += 1
+            in_block = False
+    if in_block:
+        starts[k] = start
+        ends[k] = n
+        k += 1
+    return starts[:k], ends[:k]
+
+
+def build_interval_index(intervals: List[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sort intervals once by their start, so that they can be searched with np.searchsorted.
+
+    Parameters
+    ----------
+    intervals : List[Tuple[int, int]]
+        A list of non-overlapping intervals (start, end), sorted or unsorted.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The starts and the ends of the intervals, sorted by start.
+    """
+    intervals_array = np.asarray(intervals, dtype=np.int64).reshape(-1, 2)
+    order = np.argsort(intervals_array[:, 0], kind='stable')
+    return intervals_array[order, 0], intervals_array[order, 1]
 
 
 def find_interval_containing_value(
-    intervals: List[Tuple[int, int]], value: int
+    intervals: List[Tuple[int, int]], value: int, index: Optional[Tuple[np.ndarray, np.ndarray]] = None
 ) -> Optional[Tuple[int, int]]:
     """
-    Return the first interval (start, end) that contains the specified value.
+    Return the interval (start, end) that contains the specified value.
 
     Parameters
     ----------
     intervals : List[Tuple[int, int]]
-        A list of intervals (start, end) sorted or unsorted.
+        A list of non-overlapping intervals (start, end) sorted or unsorted.
     
     value : int
         The index or position to locate within the intervals.
 
+    index : Optional[Tuple[np.ndarray, np.ndarray]]
+        The result of build_interval_index(intervals), to reuse over several queries.
+
     Returns
     -------
     Optional[Tuple[int, int]]
         The interval that contains the value, or None if not found.
     """
-    intervals_array = np.array(intervals)
-    mask = (intervals_array[:, 0] <= value) & (value < intervals_array[:, 1])
+    starts, ends = build_interval_index(intervals) if index is None else index
 
-    
-    if np.any(mask):
-        return tuple(intervals_array[mask][0])
+    # Binary search of the last interval starting at or before the value
+    i = np.searchsorted(starts, value, side='right') - 1
+    if i >= 0 and value < ends[i]:
+        return (starts[i], ends[i])
     return None
 
 
@@ -517,10 +773,11 @@ def calculate_linker_landscape(data, alpha_choice ,nt, alphaf, Lmin, Lmax, view_
 
     Notes
     -----
-    - `find_blocks()` is assumed to return pairs of linker regions based on `alpha_value`.
+    - `find_block_bounds()` is assumed to return the bounds of linker regions based on `alpha_value`.
     - Only the first position of each pair is used.
     - Linkers too close to the boundaries are excluded to ensure full window extraction.
-    - Averages are computed first for each trajectory, then globally across all.
+    - Averages are computed first for each trajectory, then globally across all (one running sum, no gathered views).
+    - For 'periodic' and 'one_random' all the rows are identical : only the first one is processed.
     """
 
     # Conditions on inputs
@@ -536,39 +793,53 @@ def calculate_linker_landscape(data, alpha_choice ,nt, alphaf, Lmin, Lmax, view_
     if len(data) != nt:
         raise ValueError("You set nt not equal to len(data)")
 
-    # Calculation
-    view_datas = np.empty((nt, view_size), dtype=float)                         # Futur return
+    # Identical rows ('periodic', 'one_random' : same landscape for all trajectories) : the linkers are found once
+    n_rows = 1 if alpha_choice in {'periodic', 'one_random'} else nt
+
+    # Calculation : one buffer summing the averages of the trajectories
+    sum_buf = np.zeros(view_size, dtype=np.float64)
 
-    # Main loop                   
-    for _ in range(0,nt):
+    # Main loop                   
+    for _ in range(0,n_rows):
 
-        # Extracting values
+        # Extracting values
         alpha_array = data[_]                                                   # Array data for one trajectory
-        pairs_of_linkers = find_blocks(array=alpha_array, alpha_value=alphaf)   # All pairs of linker zones
-        pairs_of_linkers = np.array(pairs_of_linkers, dtype=int)                # Conversion in array to get only the first values
-        column_of_linkers = pairs_of_linkers[:, 0]                              # Extracting only the first values of couples : first point
+        column_of_linkers, _ends = find_block_bounds(alpha_array, alphaf)      # First points of all the linker zones
 
         # Filtering to stay within limits
         filter_bounds = (column_of_linkers >= Lmin + threshold) & \
                         (column_of_linkers <= Lmax - threshold - view_size)
         column_of_linkers = column_of_linkers[filter_bounds]
 
-        # Initialisation of a numpy matrix for each personal linker view
-        n_linker = len(column_of_linkers)
-        view_matrix = np.empty((n_linker, view_size), dtype=float)
+        # Adding the average of the linker views of the trajectory, without gathering them
+        add_mean_of_windows(alpha_array, column_of_linkers, sum_buf)
+
+    # Last result and return
+    view_mean = sum_buf / n_rows
+    return view_mean
 
-        # Line-by-line filling
-        for rank, o_link in enumerate(column_of_linkers):
-            portion_of_alpha = alpha_array[o_link : o_link + view_size]
-            view_matrix[rank, :] = portion_of_alpha  # On suppose que portion_of_alpha a bien la bonne taille
 
-        # Getting results of one trajectory for every linkers
-        view_array = np.mean(view_matrix, axis=0)   # Average per column
-        view_datas[_] = view_array                  # Filling the all datas matrix
+@njit(cache=True)
+def add_mean_of_windows(alpha_array: np.ndarray, starts: np.ndarray, sum_buf: np.ndarray) -> None:
+    """
+    Add to sum_buf the column average of the windows alpha_array[start:start+len(sum_buf)], in place.
+    Without any window, NaNs are added (as the mean of an empty selection).
 
-    # Last result and return
-    view_mean = np.mean(view_datas, axis=0)
-    return view_mean
+    Args:
+        alpha_array (np.ndarray): Landscape of one trajectory.
+        starts (np.ndarray): First point of each window.
+        sum_buf (np.ndarray): Accumulator modified in place.
+    """
+    view_size = sum_buf.shape[0]
+    if starts.shape[0] == 0:
+        sum_buf[:] = np.nan
+        return
+    window_sum = np.zeros(view_size)
+    for start in starts:
+        for k in range(view_size):
+            window_sum[k] += alpha_array[start + k]
+    for k in range(view_size):
+        sum_buf[k] += window_sum[k] / starts.shape[0]
 
 
 # ================================================
@@ -590,14 +861,12 @@ def jump(o: int, probabilities: list) -> int:
 
     """
     
-    r = np.random.rand()    # Generate a random number in [0, 1)
-    j = 0                   # Initialize the jump counter
+    r = next(RANDOM_POOL)   # Generate a random number in [0, 1)
 
-    # Increment until the random number is less than the cumulative probability
-    while j < len(probabilities) and r >= probabilities[j]:
-        j += 1
+    # Binary search of the first cumulative probability above the random number
+    j = np.searchsorted(probabilities, r, side='right')
 
-    return o + j
+    return o + int(j)
 
 
 def attempt(alpha: float) -> bool:
@@ -613,12 +882,7 @@ def attempt(alpha: float) -> bool:
             - `True` if the attempt is successful (random number < alpha).
             - `False` otherwise.
     """
-    random_value = np.random.rand()     # Generate a random number in [0, 1)
-
-    if random_value < alpha:
-        return True
-    else:
-        return False
+    return next(RANDOM_POOL) < alpha    # Random number in [0, 1) compared to the threshold
  
 
 def unhooking(beta: float) -> bool:
@@ -634,12 +898,7 @@ def unhooking(beta: float) -> bool:
             - `True` if unhooking (stalling) occurs (random number < beta).
             - `False` otherwise.
     """
-    random_value = np.random.rand()     # Generate a random number in [0, 1)
-
-    if random_value < beta:
-        return True
-    else:
-        return False
+    return next(RANDOM_POOL) < beta     # Random number in [0, 1) compared to the threshold
 
 
 def order() -> bool:
@@ -656,12 +915,7 @@ def order() -> bool:
         - This can be used to simulate a probabilistic decision for execution order.
 
     """
-    chosen_order = np.random.choice(np.array([1, 2]))   # Randomly choose between 1 and 2
-
-    if chosen_order == 1:
-        return True
-    else:
-        return False
+    return next(RANDOM_POOL) < 0.5      # Fair choice between 1 (True) and 2 (False) : a single comparison
 
 
 def gillespie(r_tot: float) -> float:
@@ -677,55 +931,244 @@ def gillespie(r_tot: float) -> float:
         float: A random time interval (`delta_t`) sampled from an exponential distribution.
 
     Notes:
-        - The time interval is computed as `delta_t = -log(U) / r_tot`, 
+        - The time interval is computed as `delta_t = -log(1 - U) / r_tot` (log1p, never log(0)), 
           where `U` is a random number uniformly distributed in [0, 1).
         - This function is commonly used in stochastic simulation algorithms 
           such as the Gillespie algorithm.
     """
 
-    delta_t = -np.log(np.random.rand()) / r_tot     # Generate a random time interval using an exponential distribution
+    delta_t = -math.log1p(-next(RANDOM_POOL)) / r_tot   # Generate a random time interval using an exponential distribution
     return delta_t
 
 
-def folding(landscape:np.ndarray, first_origin:int) -> int:
+def folding(landscape:np.ndarray, first_origin:int, linkers:Tuple[np.ndarray, np.ndarray]=None) -> int:
     """
     Jumping on a random place around the origin, for the first position of the simulation.
 
     Args:
         landscape (np.ndarray): landscape with the minimum size for condensin to bind.
         origin (int): first point on which condensin arrives.
+        linkers (Tuple[np.ndarray, np.ndarray], optional): Bounds of the linkers of the landscape,
+            as given by find_block_bounds(landscape, 1). Computed if not given.
 
     Returns:
         int: The real origin of the simulation
     """
 
     # In order to test but normally we'll never begin any simulation on 0
-    if first_origin == 0 :
-        true_origin = 0
+    # Constant scenario : forcing the origin -> Might provoc a problem if alpha_f and alpha_o are not 0 or 1 anymore !
+    # Falling on a 1 : Validated
+    if first_origin == 0 or landscape[first_origin] != 0 :
+        return first_origin
 
-    else :
-        # Constant scenario : forcing the origin -> Might provoc a problem if alpha_f and alpha_o are not 0 or 1 anymore !
-        if landscape[first_origin] != 1 and landscape[first_origin] != 0 :
-            true_origin = first_origin        
-
-        # Falling on a 1 : Validated
-        if landscape[first_origin] == 1 :
-            true_origin = first_origin
-
-        # Falling on a 0 : Refuted
-        if landscape[first_origin] == 0 :
-            back_on_obstacle = 1
-            while landscape[first_origin-back_on_obstacle] != 1 :
-                back_on_obstacle += 1
-            pos = first_origin - back_on_obstacle
-            back_on_linker = 1
-            while landscape[pos-back_on_linker] != 0 :
-                back_on_linker += 1
-            true_origin = np.random.randint(first_origin-(back_on_obstacle+back_on_linker), first_origin-back_on_obstacle)+1
+    # Falling on a 0 : Refuted -> uniformly on the last linker before the origin (found by binary search)
+    starts, ends = linkers if linkers is not None else find_block_bounds(landscape, 1)
+    k = np.searchsorted(ends, first_origin, side='right') - 1
+    true_origin = np.random.randint(starts[k] - 1, ends[k] - 1) + 1
 
     return(true_origin)
 
 
+def folding_trajectories(alpha_matrix:np.ndarray, origin:int, nt:int) -> np.ndarray:
+    """
+    Real origins of all the trajectories (folding of every row of the landscape).
+
+    Args:
+        alpha_matrix (np.ndarray): Matrix of acceptance probability.
+        origin (int): first point on which condensin arrives.
+        nt (int): Number of trajectories.
+
+    Returns:
+        np.ndarray: The real origin of every trajectory.
+    """
+
+    # Identical rows of a broadcast landscape : the linkers are searched once
+    linkers = find_block_bounds(alpha_matrix[0], 1) if alpha_matrix.strides[0] == 0 else None
+    return np.array([folding(alpha_matrix[_], origin, linkers) for _ in range(0,nt)], dtype=np.int64)
+
+
+def run_trajectories(simulate: Callable, nt: int, capacity: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Run a compiled Gillespie driver on all the trajectories, with buffers of a given capacity.
+    The trajectories that do not fit are replayed (same seeds, same draws) with buffers twice as large.
+
+    Args:
+        simulate (Callable): simulate(rows, t_block, x_block, lengths) runs the trajectories `rows`.
+        nt (int): Number of trajectories.
+        capacity (int): Initial number of couples (t, x) per trajectory in the buffers.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: all times, all positions (one array per trajectory).
+    """
+    t_matrix = np.empty(nt, dtype=object)
+    x_matrix = np.empty(nt, dtype=object)
+
+    rows = np.arange(nt)
+    while rows.size > 0:
+        t_block = np.empty((rows.size, capacity), dtype=np.float64)    # Exact cumulative times (dwell times are differences)
+        x_block = np.empty((rows.size, capacity), dtype=np.int32)      # Positions on the chromatin : int32 is enough
+        lengths = np.empty(rows.size, dtype=np.int64)
+        simulate(rows, t_block, x_block, lengths)
+
+        # All datas of the trajectories that fit : one gather for the whole ensemble, then views per trajectory
+        fit = lengths >= 0
+        recorded = np.arange(capacity) < np.where(fit, lengths, 0)[:, np.newaxis]
+        bounds = np.cumsum(lengths[fit])[:-1]
+        for n, t_values, x_values in zip(rows[fit], np.split(t_block[recorded], bounds), np.split(x_block[recorded], bounds)):
+            t_matrix[n] = t_values
+            x_matrix[n] = x_values
+
+        rows = rows[lengths < 0]
+        capacity *= 2
+
+    return t_matrix, x_matrix
+
+
+@njit(
+    types.int64(
+        readonly_f32_1d, types.float64, readonly_f32_1d_c,
+        types.int64, types.int64, types.int64,
+        types.float64, types.float64, types.int64,
+        types.float32[::1], types.float64[::1], types.int32[::1], types.float64[::1],
+    ),
+    cache=True, error_model='numpy'
+)
+def gillespie_one_step_trajectory(
+    alpha_row: np.ndarray, beta: float, p: np.ndarray,
+    Lmax: int, origin: int, x0: int,
+    tmax: float, dt: float, seed: int,
+    results_row: np.ndarray, t_row: np.ndarray, x_row: np.ndarray, cum_rates: np.ndarray,
+    ) -> int:
+    """
+    Compiled loop on times of gillespie_algorithm_one_step, for a single trajectory.
+
+    Args:
+        alpha_row (np.ndarray): Acceptance probabilities of the trajectory.
+        beta (float): Unfolding probability (same at every position).
+        p (np.ndarray): Input probability.
+        Lmax (int): Last point of chromatin.
+        origin (int): Starting position for the simulation.
+        x0 (int): Initial point on the chromatin (after folding).
+        tmax (float): Maximum time for the simulation.
+        dt (float): Time step increment.
+        seed (int): Seed of the random draws of the trajectory.
+        results_row (np.ndarray): Row of the matrix of results, filled in place.
+        t_row (np.ndarray): Buffer receiving the times.
+        x_row (np.ndarray): Buffer receiving the recalibrated positions.
+        cum_rates (np.ndarray): Scratch buffer (at least Lmax values) for the cumulative rates of the jumps.
+
+    Returns:
+        int: Number of couples (t, x) written in the buffers, -1 if the buffers are too small.
+    """
+    np.random.seed(seed)
+
+    # Initialization of starting values
+    t = 0.0
+    x = x0
+    prev_x = x0                             # Previous position (filling the matrix)
+    ox = x0                                 # Initial point on the chromatin (used to reset trajectories to start at zero)
+    i0 = 0                                  # Initial index
+    i_max = int(tmax / dt)                  # Last index of the matrix
+    inv_dt = 1.0 / dt                       # Index of a time : int(t * inv_dt), clamped before the cast (t >= 0)
+
+    # Initial calibration
+    results_row[0] = t
+    t_row[0] = t
+    x_row[0] = 0
+    n_steps = 1
+
+    # --- Loop on times --- #
+    while (t<tmax) :
+
+        # Gillespie values : one fused pass on the reachable genome, cum_rates[k-1] : rates of the jumps 1 to k
+        # (p is cut after its last non-zero value : the jumps beyond add nothing)
+        n_jumps = Lmax - 1 - x
+        n_rates = min(n_jumps, p.shape[0] - 1)
+        rate_sum = 0.0
+        for k in range(1, n_rates + 1):
+            rate_sum += p[k] * alpha_row[x + k]
+            cum_rates[k - 1] = rate_sum
+        r_tot = beta + rate_sum
+
+        # Next time and rate of reaction : -log(1-u) never diverges, the time only does if r_tot = 0
+        # Kept finite (and not rtot) in order to capture the last jump and have weight on blocked events
+        t = min(t - math.log1p(-np.random.random())/r_tot, 1e308)
+        i = int(min(t * inv_dt, i_max))
+        r0 = np.random.rand()
+
+        # Unhooking or not
+        if r0<(beta/r_tot) :
+            results_row[i0:i+1] = prev_x                           # Last value
+            i0 = i+1
+            break
+
+        # Not beeing in a disturbed area
+        if x >= (Lmax - origin) :
+            break                                                  # No value
+
+        # Choosing the reaction : first jump di such that (beta + rates of the jumps 1 to di) >= r0 * r_tot
+        # ! di begins to 1 : p(0)=0 ! and stays below the end of the chromatin (last jump if none is reached)
+        di = np.searchsorted(cum_rates[:max(n_rates, 0)], r0 * r_tot - beta) + 1
+        if di > n_rates:
+            di = n_jumps
+        di = max(1, di)
+
+        # Updated parameters
+        x += di
+
+        # Acquisition of data
+        if n_steps >= t_row.shape[0]:
+            return -1
+        t_row[n_steps] = t
+        x_row[n_steps] = x - ox
+        n_steps += 1
+
+        # Filling (t < tmax while the loop goes on : the index stays in the matrix)
+        results_row[i0:i+1] = prev_x - ox
+        i0 = i+1
+        prev_x = x
+
+    # No value after the end of the trajectory (each cell of the row is written once : no NaN pre-filling)
+    results_row[i0:] = np.nan
+
+    return n_steps
+
+
+@njit(cache=True, parallel=True)
+def gillespie_one_step_trajectories(
+    rows: np.ndarray, alpha_matrix: np.ndarray, beta: float, p: np.ndarray,
+    Lmax: int, origin: int, x0: np.ndarray,
+    tmax: float, dt: float, seeds: np.ndarray,
+    results: np.ndarray, t_block: np.ndarray, x_block: np.ndarray, lengths: np.ndarray, cum_rates: np.ndarray,
+    ) -> None:
+    """
+    Run gillespie_one_step_trajectory on independent trajectories, in parallel.
+
+    Args:
+        rows (np.ndarray): Indices of the trajectories to simulate.
+        alpha_matrix (np.ndarray): Matrix of acceptance probability.
+        beta (float): Unfolding probability (same at every position).
+        p (np.ndarray): Input probability.
+        Lmax (int): Last point of chromatin.
+        origin (int): Starting position for the simulation.
+        x0 (np.ndarray): Initial point of every trajectory.
+        tmax (float): Maximum time for the simulation.
+        dt (float): Time step increment.
+        seeds (np.ndarray): Seed of every trajectory.
+        results (np.ndarray): Matrix of results, rows filled in place.
+        t_block (np.ndarray): Buffers receiving the times, one row per simulated trajectory.
+        x_block (np.ndarray): Buffers receiving the positions, one row per simulated trajectory.
+        lengths (np.ndarray): Receives the number of couples of every simulated trajectory (-1 : buffer too small).
+        cum_rates (np.ndarray): Scratch buffers for the cumulative rates, one row per thread.
+    """
+    for k in prange(rows.shape[0]):
+        n = rows[k]
+        lengths[k] = gillespie_one_step_trajectory(
+            alpha_matrix[n], beta, p, Lmax, origin, x0[n], tmax, dt, seeds[n],
+            results[n], t_block[k], x_block[k], cum_rates[get_thread_id()]
+        )
+
+
 # --- One step --- #
 def gillespie_algorithm_one_step(
     nt: int, tmax: float, dt: float,
@@ -752,92 +1195,205 @@ def gillespie_algorithm_one_step(
     """
 
     # --- Starting values --- #
-    beta_matrix = np.tile(np.full(lenght, beta), (nt, 1))
+    # beta is a scalar : no (nt, lenght) matrix of identical values
+    # Kernels compiled for float32 landscapes (no copy for a float32 or broadcast landscape)
+    alpha_matrix = np.asarray(alpha_matrix, dtype=np.float32)
+    # p in float32 as the landscape (gathered with it at every step), the rates are summed in float64
+    p = np.ascontiguousarray(p, dtype=np.float32)
 
-    results = np.empty((nt, int(tmax/dt)))
-    results.fill(np.nan)
+    # The rates are summed without any NaN handling (identical rows of a broadcast landscape checked once)
+    distinct_rows = alpha_matrix[:1] if alpha_matrix.strides[0] == 0 else alpha_matrix
+    if not (np.isfinite(np.sum(p)) and np.isfinite(np.sum(distinct_rows, dtype=np.float64))):
+        raise ValueError("p and alpha_matrix must only contain finite values.")
 
-    t_matrix = np.empty(nt, dtype=object)
-    x_matrix = np.empty(nt, dtype=object)
+    # Jumps of zero probability never happen : p is cut after its last non-zero value
+    p = p[:np.flatnonzero(p)[-1] + 1] if np.any(p) else p[:1]
 
-    # --- Loop on trajectories --- #
-    for _ in range(0,nt) :
-
-        # Initialization of starting values
-        t = 0
-        # x = 0
-        x = folding(alpha_matrix[_], origin)    # Initial calculation
-        prev_x = np.copy(x)                     # Copy for later use (filling the matrix)
-        ox = np.copy(x)                         # Initial point on the chromatin (used to reset trajectories to start at zero)
-        i0 = 0                                  # Initial index
-        i = 0                                   # Current index
-
-        # Initial calibration
-        results[_][0] = t                       # Store the initial time
-        t_list = [t]                            # List to track time points
-        x_list = [x-ox]                         # List to track recalibrated positions
-
-        # --- Loop on times --- #
-        while (t<tmax) :
-
-            # Gillespie values : scanning the all genome
-            r_tot = beta_matrix[_][x] + np.nansum(p[1:(Lmax-x)] * alpha_matrix[_][(x+1):Lmax])
-
-            # # Jumping or unbinding : condition on inf times (other version)
-            # if np.isinf(t_jump):                # Possibility of generating an infinite time because of no accessible positions
-            #     results[_][i0:] = x-ox          # Filling with the last value
-            #     break                           # Breaking the loop
-
-            # Next time and rate of reaction
-            t = t - np.log(np.random.rand())/r_tot
-            r0 = np.random.rand()
-
-            # Condition on time (and not on rtot) in order to capture the last jump and have weight on blocked events
-            if np.isinf(t) == True:
-                t = 1e308
-
-            # Unhooking or not
-            if r0<(beta_matrix[_][x]/r_tot) :
-                i = int(np.floor(t/dt))                                     # Last time
-                results[_][i0:int(min(np.floor(tmax/dt),i)+1)] = prev_x     # Last value
-                break
-
-            # Not beeing in a disturbed area
-            if x >= (Lmax - origin) :
-                i = int(np.floor(t/dt))                                     # Last time
-                results[_][i0:int(min(np.floor(tmax/dt),i)+1)] = np.nan     # No value
-                # print('Loop extrusion arrival at the end of the chain.')
-                break
-
-            # Choosing the reaction
-            else :
-                di = 1                                                      # ! di begins to 1 : p(0)=0 !
-                rp = beta_matrix[_][x] + p[di] * alpha_matrix[_][x+di]      # Gillespie reaction rate
-
-                while ((rp/r_tot)<r0) and (di<Lmax-1-x) :                   # Sum on all possible states
-                    di += 1                                                 # Determining the rank of jump
-                    rp += p[di] * alpha_matrix[_][x+di]                     # Sum : element per element
-
-            # Updated parameters
-            x += di
-
-            # Acquisition of data
-            t_list.append(t)
-            x_list.append(x-ox)
-
-            # Filling 
-            i = int(np.floor(t/dt))
-            results[_][i0:int(min(np.floor(tmax/dt),i)+1)] = int(prev_x-ox)
-            i0 = i+1
-            prev_x = np.copy(x)
+    # Rows written once by the kernels, NaN after the end of each trajectory (positions are exact in float32)
+    results = np.empty((nt, int(tmax/dt)), dtype=np.float32)
+
+    # Initial points on the chromatin (trajectories are recalibrated to start at zero) and seeds of the trajectories
+    x0 = folding_trajectories(alpha_matrix, origin, nt)
+    seeds = np.random.randint(0, 2**31 - 1, size=nt, dtype=np.int64)
+
+    # Jumps happen at a rate below beta + sum(p) (alpha <= 1) and move forward : Lmax + 1 couples (t, x) at most
+    capacity = min(Lmax + 2, 2 * int(np.ceil(tmax * (beta + np.nansum(p)))) + 64)
+
+    # Scratch buffers for the cumulative rates of the jumps, one per thread
+    cum_rates = np.empty((get_num_threads(), Lmax), dtype=np.float64)
 
-        # All datas
-        t_matrix[_] = t_list
-        x_matrix[_] = x_list
+    # --- Loop on trajectories : compiled, in parallel --- #
+    def simulate(rows, t_block, x_block, lengths):
+        gillespie_one_step_trajectories(
+            rows, alpha_matrix, beta, p, Lmax, origin, x0, tmax, dt, seeds,
+            results, t_block, x_block, lengths, cum_rates
+        )
+
+    t_matrix, x_matrix = run_trajectories(simulate, nt, capacity)
 
     return results, t_matrix, x_matrix
 
 
+@njit(
+    types.int64(
+        readonly_f32_1d, readonly_f64_1d_c, readonly_i64_1d_c,
+        types.float64, types.float64, types.float64,
+        types.int64, types.int64,
+        types.float64, types.float64, types.int64,
+        types.float32[::1], types.float64[::1], types.int32[::1],
+    ),
+    cache=True, error_model='numpy'
+)
+def gillespie_two_steps_trajectory(
+    alpha_row: np.ndarray, cdf: np.ndarray, L: np.ndarray,
+    lmbda: float, rtot_bind: float, rtot_rest: float,
+    origin: int, x0: int,
+    tmax: float, dt: float, seed: int,
+    results_row: np.ndarray, t_row: np.ndarray, x_row: np.ndarray,
+    ) -> int:
+    """
+    Compiled loop on times of gillespie_algorithm_two_steps, for a single trajectory.
+
+    Args:
+        alpha_row (np.ndarray): Acceptance probabilities of the trajectory.
+        cdf (np.ndarray): Normalized cumulative distribution of the probability array for transitions.
+        L (np.ndarray): Chromatin structure array (possible jumps).
+        lmbda (float): Probability to perform a reverse jump after a forward move.
+        rtot_bind (float): Reaction rate for binding events.
+        rtot_rest (float): Reaction rate for resting events.
+        origin (int): Initial position in the simulation.
+        x0 (int): Initial point on the chromatin (after folding).
+        tmax (float): Maximum simulation time.
+        dt (float): Time step increment.
+        seed (int): Seed of the random draws of the trajectory.
+        results_row (np.ndarray): Row of the matrix of results, filled in place.
+        t_row (np.ndarray): Buffer receiving the times.
+        x_row (np.ndarray): Buffer receiving the recalibrated positions.
+
+    Returns:
+        int: Number of couples (t, x) written in the buffers, -1 if the buffers are too small.
+    """
+    np.random.seed(seed)
+
+    # Initialization of starting values
+    t = 0.0
+    x = x0
+    prev_x = x0                             # Previous position (filling the matrix)
+    ox = x0                                 # Initial point on the chromatin (used to reset trajectories to start at zero)
+    i0 = 0                                  # Initial index
+    i_max = int(tmax / dt)                  # Last index of the matrix
+    inv_dt = 1.0 / dt                       # Index of a time : int(t * inv_dt), clamped before the cast (t >= 0)
+    x_end = L.max() - origin                # Edge of the disturbed area
+
+    # Initial calibration
+    results_row[0] = t
+    t_row[0] = t
+    x_row[0] = 0
+    n_steps = 1
+
+    # --- Loop on times --- #
+    while (t<tmax) :
+
+        # --- Unbinding or not --- #
+
+        # # Not needed for the moment (beta is a scalar)
+        # r0_unbind = np.random.rand()
+        # if r0_unbind<beta:
+        #     results_row[i0:int(min(t * inv_dt, i_max))+1] = prev_x-ox    # Last value
+        #     i0 = int(min(t * inv_dt, i_max))+1
+        #     break
+
+        # --- Jumping : mandatory --- #
+
+        # Drawn as np.random.choice(L, p=p) does : binary search in the normalized cumulative distribution
+        x += L[np.searchsorted(cdf, np.random.random(), side='right')]
+
+        # --- Jumping : edge conditions  --- #
+        if x >= x_end :
+            break                                               # No value
+
+        # --- Binding or Abortion --- #
+
+        # Two couples (t, x) recorded per tentative
+        if n_steps + 2 > t_row.shape[0]:
+            return -1
+
+        # Binding : values
+        r_bind = alpha_row[x]
+        t_bind = - math.log1p(-np.random.random())/rtot_bind    # Random time of bind or abortion
+        r0_bind = np.random.rand()                              # Random event of bind or abortion
+
+        # Binding : whatever happens loop extrusion spends time trying to bind event if it fails (time kept finite)
+        t = min(t + t_bind, 1e308)
+
+        # Acquisition 1
+        t_row[n_steps] = t
+        x_row[n_steps] = x - ox
+        n_steps += 1
+
+        # Binding : Loop Extrusion does occur - it will have to rest
+        if r0_bind < r_bind * (1-lmbda):
+            t_rest = - math.log1p(-np.random.random())/rtot_rest
+            t = min(t + t_rest, 1e308)
+
+        # Binding : Loop Extrusion does not occur - it will not have to rest
+        else :
+            x = prev_x
+
+        # Acquisition 2
+        t_row[n_steps] = t
+        x_row[n_steps] = x - ox
+        n_steps += 1
+
+        # Filling (t < tmax while the loop goes on : the index stays in the matrix)
+        i = int(min(t * inv_dt, i_max))
+        results_row[i0:i+1] = prev_x - ox
+        i0 = i+1
+        prev_x = x
+
+    # No value after the end of the trajectory (each cell of the row is written once : no NaN pre-filling)
+    results_row[i0:] = np.nan
+
+    return n_steps
+
+
+@njit(cache=True, parallel=True)
+def gillespie_two_steps_trajectories(
+    rows: np.ndarray, alpha_matrix: np.ndarray, cdf: np.ndarray, L: np.ndarray,
+    lmbda: float, rtot_bind: float, rtot_rest: float,
+    origin: int, x0: np.ndarray,
+    tmax: float, dt: float, seeds: np.ndarray,
+    results: np.ndarray, t_block: np.ndarray, x_block: np.ndarray, lengths: np.ndarray,
+    ) -> None:
+    """
+    Run gillespie_two_steps_trajectory on independent trajectories, in parallel.
+
+    Args:
+        rows (np.ndarray): Indices of the trajectories to simulate.
+        alpha_matrix (np.ndarray): Matrix of acceptance probabilities.
+        cdf (np.ndarray): Normalized cumulative distribution of the probability array for transitions.
+        L (np.ndarray): Chromatin structure array (possible jumps).
+        lmbda (float): Probability to perform a reverse jump after a forward move.
+        rtot_bind (float): Reaction rate for binding events.
+        rtot_rest (float): Reaction rate for resting events.
+        origin (int): Initial position in the simulation.
+        x0 (np.ndarray): Initial point of every trajectory.
+        tmax (float): Maximum simulation time.
+        dt (float): Time step increment.
+        seeds (np.ndarray): Seed of every trajectory.
+        results (np.ndarray): Matrix of results, rows filled in place.
+        t_block (np.ndarray): Buffers receiving the times, one row per simulated trajectory.
+        x_block (np.ndarray): Buffers receiving the positions, one row per simulated trajectory.
+        lengths (np.ndarray): Receives the number of couples of every simulated trajectory (-1 : buffer too small).
+    """
+    for k in prange(rows.shape[0]):
+        n = rows[k]
+        lengths[k] = gillespie_two_steps_trajectory(
+            alpha_matrix[n], cdf, L, lmbda, rtot_bind, rtot_rest, origin, x0[n], tmax, dt, seeds[n],
+            results[n], t_block[k], x_block[k]
+        )
+
+
 # --- Two steps --- #
 def gillespie_algorithm_two_steps(
     alpha_matrix: np.ndarray,
@@ -877,101 +1433,34 @@ def gillespie_algorithm_two_steps(
 
 
     # --- Starting values --- #
-    # beta_matrix = np.tile(np.full(len(L)*bps, beta), (nt, 1))
-
-    results = np.empty((nt, int(tmax/dt)))
-    results.fill(np.nan)
-
-    t_matrix = np.empty(nt, dtype=object)
-    x_matrix = np.empty(nt, dtype=object)
-
-    # --- Loop on trajectories --- #
-    for _ in range(0,nt) :
-
-        # Initialization of starting values
-        t, t_bind, t_rest = 0, 0, 0           # First times
-        x = folding(alpha_matrix[_], origin)  # Initial calculation
-        prev_x = np.copy(x)                   # Copy for later use (filling the matrix)
-        ox = np.copy(x)                       # Initial point on the chromatin (used to reset trajectories to start at zero)
-
-        # Model 
-        i0, i = 0, 0
-
-        # Initial calibration
-        results[_][0] = t                     # Store the initial time
-        t_list = [t]                          # List to track time points
-        x_list = [x-ox]                       # List to track recalibrated positions
-
-        # --- Loop on times --- #
-        while (t<tmax) :
-
-            # --- Unbinding or not --- #
-
-            # # Not needed for the moment
-            # r0_unbind = np.random.rand()
-            # if r0_unbind<(beta_matrix[_][x]):
-            #     i = int(np.floor(t/dt))                                         # Last time
-            #     results[_][i0:int(min(np.floor(tmax/dt),i)+1)] = prev_x-ox      # Last value
-            #     break
-
-            # --- Jumping : mandatory --- #
-
-            # Almost instantaneous jumps (approx. 20 ms)
-            x_jump = np.random.choice(L, p=p)       # Gives the x position
-            x += x_jump                             # Whatever happens loop extrusion spends time trying to extrude
-
-            # --- Jumping : edge conditions  --- #
-            if x >= (np.max(L) - origin) :
-                i = int(np.floor(t/dt))                                         # Last time
-                results[_][i0:int(min(np.floor(tmax/dt),i)+1)] = np.nan         # Last value
-                break
-
-            # --- Binding or Abortion --- #
-
-            # Binding : values
-            r_bind = alpha_matrix[_][x]
-            t_bind = - np.log(np.random.rand())/rtot_bind       # Random time of bind or abortion
-            r0_bind = np.random.rand()                          # Random event of bind or abortion
-
-            # Condition on time for tentative
-            if np.isinf(t_bind) == True:
-                t = 1e308
+    # beta is a scalar : no (nt, len(L)) matrix of identical values
+    # Kernels compiled for float32 landscapes (no copy for a float32 or broadcast landscape)
+    alpha_matrix = np.asarray(alpha_matrix, dtype=np.float32)
+    p = np.ascontiguousarray(p, dtype=np.float64)
+    L = np.ascontiguousarray(L, dtype=np.int64)
 
-            # Binding : whatever happens loop extrusion spends time trying to bind event if it fails  
-            t += t_bind
+    # Cumulative distribution of the jumps, built once for all the draws
+    cdf = np.cumsum(p)
+    cdf /= cdf[-1]
 
-            # Acquisition 1
-            t_list.append(t)
-            x_list.append(x-ox)
-      
-            # Binding : Loop Extrusion does occur - it will have to rest
-            if r0_bind < r_bind * (1-lmbda):
-                LE = True
-                t_rest = - np.log(np.random.rand())/rtot_rest
+    # Rows written once by the kernels, NaN after the end of each trajectory (positions are exact in float32)
+    results = np.empty((nt, int(tmax/dt)), dtype=np.float32)
 
-                if np.isinf(t_rest) == True:
-                    t_rest = 1e308
+    # Initial points on the chromatin (trajectories are recalibrated to start at zero) and seeds of the trajectories
+    x0 = folding_trajectories(alpha_matrix, origin, nt)
+    seeds = np.random.randint(0, 2**31 - 1, size=nt, dtype=np.int64)
 
-                t += t_rest
+    # Two couples (t, x) per binding tentative, about tmax * rtot_bind tentatives
+    capacity = 4 * int(np.ceil(tmax * rtot_bind)) + 64
 
-            # Binding : Loop Extrusion does not occur - it will not have to rest
-            else : 
-                LE = False
-                x = prev_x
+    # --- Loop on trajectories : compiled, in parallel --- #
+    def simulate(rows, t_block, x_block, lengths):
+        gillespie_two_steps_trajectories(
+            rows, alpha_matrix, cdf, L, lmbda, rtot_bind, rtot_rest, origin, x0, tmax, dt, seeds,
+            results, t_block, x_block, lengths
+        )
 
-            # Acquisition 2
-            t_list.append(t)
-            x_list.append(x-ox)
-
-            # Filling
-            i = int(np.floor(t/dt))                                   
-            results[_][i0:int(min(np.floor(tmax/dt),i)+1)] = int(prev_x-ox)
-            i0 = i+1
-            prev_x = np.copy(x)
-
-        # All datas
-        t_matrix[_] = t_list
-        x_matrix[_] = x_list
+    t_matrix, x_matrix = run_trajectories(simulate, nt, capacity)
 
     return results, t_matrix, x_matrix
 
@@ -1002,20 +1491,17 @@ def calculate_obs_and_linker_distribution(
             - distrib_l (np.ndarray): Normalized distribution of linker lengths.
     """
     # Masks for obstacles and linkers
-    mask_o = alpha_array == alphao
-    mask_l = alpha_array == alphaf
+    value_type = alpha_array.dtype.type     # Values compared in the precision of the landscape (float32)
+    mask_o = alpha_array == value_type(alphao)
+    mask_l = alpha_array == value_type(alphaf)
 
     # Find lengths of obstacle sequences
-    diffs_o = np.diff(np.concatenate(([0], mask_o.astype(int), [0])))
-    starts_o = np.where(diffs_o == 1)[0]
-    ends_o = np.where(diffs_o == -1)[0]
-    counts_o = ends_o - starts_o
+    edges_o = np.flatnonzero(np.diff(np.r_[False, mask_o, False]))    # bool diff : changes of the mask, start then end
+    counts_o = edges_o[1::2] - edges_o[::2]
 
     # Find lengths of linker sequences
-    diffs_l = np.diff(np.concatenate(([0], mask_l.astype(int), [0])))
-    starts_l = np.where(diffs_l == 1)[0]
-    ends_l = np.where(diffs_l == -1)[0]
-    counts_l = ends_l - starts_l
+    edges_l = np.flatnonzero(np.diff(np.r_[False, mask_l, False]))    # bool diff : changes of the mask, start then end
+    counts_l = edges_l[1::2] - edges_l[::2]
 
     # Handle empty counts
     if counts_o.size == 0:
@@ -1059,9 +1545,9 @@ def calculate_main_results(results: np.ndarray, dt: float, alpha_0: float, nt: i
         - Bootstrapping is used to estimate the error of the mean velocity.
     """
 
-    mean_results = np.nanmean(results, axis=0)                    # Calculate mean trajectory across all trajectories
+    mean_results = np.nanmean(results, axis=0, dtype=np.float64)  # Calculate mean trajectory across all trajectories
     med_results = np.nanmedian(results, axis=0)                   # Calculate median trajectory across all trajectories
-    std_results = np.nanstd(results, axis=0)                      # Calculate the standard deviation of the trajectories
+    std_results = np.nanstd(results, axis=0, dtype=np.float64)    # Calculate the standard deviation of the trajectories
 
     v_mean = linear_fit(mean_results, dt) * alpha_0            # Calculate the velocity for the mean trajectory
     v_med = linear_fit(med_results, dt) * alpha_0              # Calculate the velocity for the median trajectory
@@ -1090,26 +1576,22 @@ def calculate_position_histogram(results: list, Lmax: int, origin: int, tmax: in
         - If no data exists for a time step, the corresponding histogram is filled with zeros.
     """
 
-    results_transposed = np.array(results).T                # Transpose the results to process positions at each time step
-    num_bins = np.arange(0, Lmax - (2 * origin) + 1, 1)     # Define the bins for the histogram
-    histograms = [None] * (tmax // time_step)               # Initialize the list for histograms
+    results_transposed = np.asarray(results).T              # Transpose the results to process positions at each time step
+    n_bins = Lmax - (2 * origin)                            # Unit bins from 0 to Lmax - 2 * origin (last one closed)
+    positions = results_transposed[0:tmax:time_step]        # Positions at each time step
 
-    # Calculate the histogram for each time step
-    for t in range(0, tmax, time_step):
-        bin_counts, _ = np.histogram(results_transposed[t], bins=num_bins)
-        histograms[t] = bin_counts
+    # Counts of all the time steps at once : bin of each position, offset by its time step, in a single bincount
+    valid = (positions >= 0) & (positions <= n_bins)        # NaN and out of the domain positions are not counted
+    bins = np.minimum(np.floor(positions[valid]).astype(np.intp), n_bins - 1)
+    steps = np.nonzero(valid)[0]
+    counts = np.bincount(steps * n_bins + bins, minlength=positions.shape[0] * n_bins).reshape(positions.shape[0], n_bins)
 
-    # Normalize the histograms to probabilities
-    histograms_list = [arr.tolist() for arr in histograms]
-    for t in range(0, tmax, time_step):
-        total_count = np.sum(histograms_list[t])
-        if total_count != 0:
-            histograms_list[t] = np.divide(histograms_list[t], total_count)
-        else:
-            histograms_list[t] = np.zeros_like(histograms_list[t])
+    # Normalize the histograms to probabilities (zeros if no data exists for a time step)
+    totals = counts.sum(axis=1, keepdims=True)
+    histograms = np.divide(counts, totals, out=np.zeros(counts.shape), where=totals != 0)
 
-    # Convert the list of histograms to a NumPy array and transpose it
-    histograms_array = np.copy(histograms_list).T
+    # Rows are the bins and columns the time steps
+    histograms_array = histograms.T
 
     return histograms_array
 
@@ -1161,8 +1643,11 @@ def calculate_distrib_tbjs(matrix_t : np.ndarray, last_bin: float = 1e5):
     # Flatten matrix_t and compute time differences
     tbj_list = np.diff(np.concatenate(matrix_t))               # Differences between jumps
 
-    # Create histogram
-    tbj_distrib, _ = np.histogram(tbj_list, bins=tbj_bins)     # Compute histogram
+    # Create histogram : unit bins from 0, so the bin of a time is its integer part (last edge included, as in np.histogram)
+    n_bins = tbj_bins.size - 1
+    valid = (tbj_list >= 0) & (tbj_list <= tbj_bins[-1])      # NaN, negative (between two trajectories) and too long times dropped
+    indices = np.minimum(tbj_list[valid].astype(np.intp), n_bins - 1)
+    tbj_distrib = np.bincount(indices, minlength=n_bins)
 
     # Normalize the distribution
     if np.sum(tbj_distrib) != 0:
@@ -1174,6 +1659,24 @@ def calculate_distrib_tbjs(matrix_t : np.ndarray, last_bin: float = 1e5):
     return tbj_bins[:-1], tbj_distrib
 
 
+@njit(cache=True)
+def scatter_intervals(time_index: np.ndarray, bin_start: np.ndarray, bin_end: np.ndarray, matrix: np.ndarray) -> None:
+    """
+    Write the difference array of the intervals [bin_start, bin_end) of each row time_index, in place.
+    Bins past the last column are clipped to it (the last column is a sentinel).
+
+    Args:
+        time_index (np.ndarray): Row of each interval.
+        bin_start (np.ndarray): First bin of each interval.
+        bin_end (np.ndarray): Bin after the last one of each interval.
+        matrix (np.ndarray): Difference array, cumulated along the columns by the caller.
+    """
+    last_column = matrix.shape[1] - 1
+    for k in range(time_index.shape[0]):
+        matrix[time_index[k], min(bin_start[k], last_column)] += 1
+        matrix[time_index[k], min(bin_end[k], last_column)] -= 1
+
+
 def calculate_fpt_matrix(matrix_t: np.ndarray, matrix_x: np.ndarray, tmax: int, t_bin: int) -> tuple[np.ndarray, np.ndarray] :
     """
     Calculate the first passage time (FPT) density using bins to reduce memory usage.
@@ -1193,21 +1696,28 @@ def calculate_fpt_matrix(matrix_t: np.ndarray, matrix_x: np.ndarray, tmax: int,
             - fpt_number (np.ndarray): Number of trajectories that reached the positions.
     """
     
-    x_max = np.max(np.concatenate(matrix_x))
+    x_all = np.concatenate(matrix_x)
+    t_all = np.concatenate(matrix_t)
+    x_max = np.max(x_all)
     n_bins = math.ceil(x_max / t_bin)
-    fpt_matrix = np.zeros((tmax + 1, n_bins))
     nt = len(matrix_t)
 
-    translated_all_x = [[x - sublist[0] for x in sublist] for sublist in matrix_x]
+    # Positions translated to the start of their own trajectory
+    lengths = [len(x) for x in matrix_x]
+    first_points = np.cumsum(lengths) - lengths
+    translated_all_x = x_all - np.repeat(x_all[first_points], lengths)
 
-    # I : matrix
-    couples = np.concatenate([list(zip(x, [min(math.floor(ti), tmax) for ti in t])) for x, t in zip(translated_all_x, matrix_t)])
+    # Each couple that moved away from the start covers the bins [start, end) at its time (nothing if it went back)
+    jump_index = np.flatnonzero(translated_all_x != 0)
+    time_index = np.minimum(np.floor(t_all[jump_index]), tmax).astype(np.int64)
+    bin_index_start = (translated_all_x[jump_index - 1] // t_bin).astype(np.int64)
+    bin_index_end = (translated_all_x[jump_index] // t_bin).astype(np.int64)
+    forward = bin_index_start < bin_index_end
 
-    for _ in range(len(couples)):
-        if couples[_][0] != 0:
-            bin_index_start = couples[_ - 1][0] // t_bin
-            bin_index_end = couples[_][0] // t_bin
-            fpt_matrix[couples[_][1]][bin_index_start:bin_index_end ] += 1
+    # I : matrix (difference array : +1 at the start of each interval, -1 at its end, then cumulative sum)
+    fpt_matrix = np.zeros((tmax + 1, n_bins + 1))
+    scatter_intervals(time_index[forward], bin_index_start[forward], bin_index_end[forward], fpt_matrix)
+    fpt_matrix = np.cumsum(fpt_matrix, axis=1)[:, :n_bins]
 
     # II : curve
     fpt_number = np.sum(fpt_matrix, axis=0)
@@ -1260,32 +1770,17 @@ def calculate_instantaneous_statistics(
             - v_mp (float): Most probable instantaneous speed.
     """
 
-    # Initialize arrays for displacements, time intervals, and speeds
-    dx_array = np.array([None] * n_t, dtype=object)
-    dt_array = np.array([None] * n_t, dtype=object)
-    vi_array = np.array([None] * n_t, dtype=object)
-
-    # Loop through each trajectory
-    for i in range(n_t):
-        x = np.array(matrix_x[i])
-        t = np.array(matrix_t[i])
-
-        # Calculate displacements (Δx) and time intervals (Δt)
-        dx = x[1:] - x[:-1]
-        dt = t[1:] - t[:-1]
+    # All the trajectories in one flat pass : differences between consecutive points of a same trajectory
+    lengths = [len(matrix_x[i]) for i in range(n_t)]
+    trajectory_id = np.repeat(np.arange(n_t), lengths)
+    same_trajectory = trajectory_id[1:] == trajectory_id[:-1]
 
-        # Calculate instantaneous speeds (Δx / Δt)
-        dv = dx / dt
+    # Calculate displacements (Δx) and time intervals (Δt)
+    dx_array = np.diff(np.concatenate(matrix_x[:n_t]))[same_trajectory]
+    dt_array = np.diff(np.concatenate(matrix_t[:n_t]))[same_trajectory]
 
-        # Store results in arrays
-        dx_array[i] = dx
-        dt_array[i] = dt
-        vi_array[i] = dv
-
-    # Concatenate arrays for all trajectories
-    dx_array = np.concatenate(dx_array)
-    dt_array = np.concatenate(dt_array)
-    vi_array = np.concatenate(vi_array)
+    # Calculate instantaneous speeds (Δx / Δt)
+    vi_array = dx_array / dt_array
 
     # Calculate distributions for Δx, Δt, and speeds
     dx_points, dx_distrib = calculate_distribution(dx_array, first_bin, last_bin, bin_width)
@@ -1344,16 +1839,17 @@ def filtering_before_fit(
     # Condition on lenghts
     if len(time) == len(data) == len(std) :
 
-        # Convert inputs to NumPy arrays if they are not already
-        time = np.array(time)
-        data = np.array(data)
-        std = np.array(std)
+        # Convert inputs to NumPy arrays if they are not already (no copy of arrays)
+        time = np.asarray(time)
+        data = np.asarray(data)
+        std = np.asarray(std)
 
-        # Filter out NaN, infinite values, and invalid data points
-        valid_idx = ~np.isnan(data) & ~np.isnan(std) & ~np.isinf(data) & ~np.isinf(std)
-        time = time[valid_idx]
-        data = data[valid_idx]
-        std = std[valid_idx]
+        # Filter out NaN, infinite values, and invalid data points (one test per array, nothing to copy if all valid)
+        valid_idx = np.isfinite(data) & np.isfinite(std)
+        if not valid_idx.all():
+            time = time[valid_idx]
+            data = data[valid_idx]
+            std = std[valid_idx]
 
         # Replace standard deviations of 0 with a small positive value
         std = np.where(std == 0, 1e-10, std)
@@ -1401,28 +1897,22 @@ def fitting_in_two_steps(times, positions, deviations, bound_low=5, bound_high=8
         return None, None, None, None, None, None, None, None, None, None
 
     # Remove the first point to avoid (0, 0)
-    times = times[1:]
-    positions = positions[1:]
-
-    # Step 1: linear average of x(t)/t over early time
-    xt_over_t = np.divide(positions, times)
-    array_low = xt_over_t[:bound_low]
-    vf = np.mean(array_low)
-    vf_std = np.std(array_low)
+    times = np.ascontiguousarray(times[1:], dtype=np.float64)
+    positions = np.ascontiguousarray(positions[1:], dtype=np.float64)
 
-    # Step 2: logarithmic Derivative (G) to observe where the bound_high is - helps plots
-    dlogx = np.diff(np.log(positions))
-    dlogt = np.diff(np.log(times))
-    G = np.divide(dlogx, dlogt)
+    # Step 1 and 2 : linear average of x(t)/t over early time, logarithmic Derivative (G) - compiled, one pass
+    # (the logarithms of the times come from the cache of the grid, those of the positions are computed once)
+    log_t = make_log_times(times.tobytes())
+    xt_over_t, G, vf, vf_std, log_x = two_steps_fit_core(times, log_t, positions, bound_low)
 
     # Step 3: check if there are enough points for log-log fit
     if len(times) <= bound_high + 1:
         return np.round(vf, rf), None, None, np.round(vf_std, rf), None, None, None, None, None, None
 
     # Step 4: log-log fit of x(t) = Cf * t^wf on the right side
-    log_t_high = np.log(times[bound_high:])
-    log_x_high = np.log(np.maximum(positions[bound_high:], epsilon))
-    slope, intercept, r_value, p_value, std_err_slope = linregress(log_t_high, log_x_high)
+    log_t_high = log_t[bound_high:]
+    log_x_high = np.fmax(log_x[bound_high:], np.log(epsilon))    # log(max(x, epsilon)) : log is increasing (fmax : log of x <= 0)
+    slope, intercept, std_err_slope = linear_regression(log_t_high, log_x_high)
 
     # Fit results
     Cf = np.exp(intercept)
@@ -1441,32 +1931,143 @@ def fitting_in_two_steps(times, positions, deviations, bound_low=5, bound_high=8
     )
 
 
+@lru_cache(maxsize=8)
+def make_log_times(times_bytes: bytes) -> np.ndarray:
+    """
+    Logarithms of a time grid, computed once per grid : all the parameter sets of a run share the same times.
+
+    Args:
+        times_bytes (bytes): Raw float64 buffer of the times (first point removed), used as the cache key.
+
+    Returns:
+        np.ndarray: Read-only logarithms of the times.
+    """
+    log_t = np.log(np.frombuffer(times_bytes, dtype=np.float64))
+    log_t.flags.writeable = False       # Shared between calls : protected against in place edits
+    return log_t
+
+
+@njit(cache=True, error_model='numpy')
+def two_steps_fit_core(
+    times: np.ndarray, log_t: np.ndarray, positions: np.ndarray, bound_low: int
+) -> Tuple[np.ndarray, np.ndarray, float, float, np.ndarray]:
+    """
+    Compiled core of fitting_in_two_steps : x(t)/t with its early average, and the logarithmic derivative,
+    with a single logarithm per position.
+
+    Args:
+        times (np.ndarray): Array of time values (first point removed).
+        log_t (np.ndarray): Logarithms of the times (see make_log_times).
+        positions (np.ndarray): Array of average positions (x(t)).
+        bound_low (int): Number of initial points to use for the linear average.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, float, float, np.ndarray]: x(t)/t, logarithmic derivative G,
+            average and standard deviation of x(t)/t, logarithms of the positions.
+    """
+    n = times.shape[0]
+
+    # Step 1: linear average of x(t)/t over early time
+    xt_over_t = np.empty(n)
+    for k in range(n):
+        xt_over_t[k] = positions[k] / times[k]
+    vf = np.mean(xt_over_t[:bound_low])
+    vf_std = np.std(xt_over_t[:bound_low])
+
+    # Step 2: logarithmic Derivative (G) to observe where the bound_high is - helps plots
+    log_x = np.log(positions)
+    G = np.empty(max(n - 1, 0))
+    for k in range(n - 1):
+        G[k] = (log_x[k+1] - log_x[k]) / (log_t[k+1] - log_t[k])
+
+    return xt_over_t, G, vf, vf_std, log_x
+
+
+@njit(cache=True)
+def linear_regression(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Least squares line y = slope * x + intercept, as scipy.stats.linregress computes it,
+    without the correlation and the p-value (no Student-t distribution).
+
+    Args:
+        x (np.ndarray): Abscissas (at least two distinct values).
+        y (np.ndarray): Ordinates.
+
+    Returns:
+        Tuple[float, float, float]: Slope, intercept and standard error of the slope.
+    """
+    n = x.shape[0]
+    x_mean = np.mean(x)
+    y_mean = np.mean(y)
+
+    # Centered sums in one pass
+    sxx = 0.0
+    sxy = 0.0
+    syy = 0.0
+    for k in range(n):
+        dx = x[k] - x_mean
+        dy = y[k] - y_mean
+        sxx += dx * dx
+        sxy += dx * dy
+        syy += dy * dy
+
+    slope = sxy / sxx
+    intercept = y_mean - slope * x_mean
+
+    # Standard error of the slope : residual variance over the spread of x (exact line through two points)
+    if n == 2:
+        return slope, intercept, 0.0
+    residuals = max(syy - slope * sxy, 0.0)
+    std_err_slope = np.sqrt(residuals / ((n - 2) * sxx))
+
+    return slope, intercept, std_err_slope
+
+
 # ================================================
 # Part 2.7 : Writing functions
 # ================================================
 
 
-def set_working_environment(base_dir: str = "nucleo/outputs", subfolder: str = "") -> None:
+def set_working_environment(base_dir: str = "nucleo/outputs", subfolder: str = "") -> str:
     """
-    Ensure the specified folder exists and change the current working directory to it.
+    Ensure the specified folder exists and return its absolute path.
         Check if the folder exists; if not, create it
-        Change the current working directory to the specified folder
+        The current working directory is left unchanged : the writers get the path instead
 
     Args:
-        folder_path (str): Path to the folder where the working environment should be set.
+        base_dir (str): Path to the folder where the working environment should be set.
+        subfolder (str): Optional subfolder inside base_dir.
 
     Returns:
-        None.
+        str: Absolute path of the folder.
     """
     root = os.getcwd()
     full_path = os.path.join(root, base_dir, subfolder)
     
     os.makedirs(full_path, exist_ok=True)
-    os.chdir(full_path)
 
     return full_path
 
 
+def simulation_title(
+    alpha_choice: str, s: int, l: int, bpmin: int,
+    mu: float, theta: float, lmbda: float, rtot_bind: float, rtot_rest: float,
+    nt: int
+) -> str:
+    """
+    Name of the folder and of the Parquet file of a parameter set.
+
+    Returns:
+        str: Title of the simulation.
+    """
+    return (
+        f"alphachoice={alpha_choice}_s={s}_l={l}_bpmin={bpmin}_"
+        f"mu={mu}_theta={theta}_"
+        f"lmbda={lmbda:.2e}_rtotbind={rtot_bind:.2e}_rtotrest={rtot_rest:.2e}_"
+        f"nt={nt}"
+    )
+
+
 def prepare_value(value):
     """
     Convert various data types to Parquet-compatible formats, including deep handling of NaNs.
@@ -1483,7 +2084,17 @@ def prepare_value(value):
     """
     # Convert NumPy matrix or array to list
     if isinstance(value, (np.ndarray, np.matrix)):
-        return [prepare_value(v) for v in np.array(value).tolist()]
+        array = np.asarray(value)
+
+        # Numeric arrays : NaNs replaced by None in one vectorized pass
+        if array.dtype.kind in 'biu':
+            return array.tolist()
+        if array.dtype.kind == 'f':
+            clean = array.astype(object)
+            clean[np.isnan(array)] = None
+            return clean.tolist()
+
+        return [prepare_value(v) for v in array.tolist()]
 
     # Convert NumPy scalars to native scalars
     elif isinstance(value, (np.integer, np.floating)):
@@ -1511,7 +2122,53 @@ def prepare_value(value):
         raise ValueError(f"Unsupported data type: {type(value)}")
 
 
-def writing_parquet(file:str, title: str, data_result: dict, data_info = False) -> None:
+def array_to_arrow(value: np.ndarray) -> pa.Array:
+    """
+    Convert a numeric NumPy array into a one-row (nested) Arrow list column, without going through Python lists.
+    NaNs become nulls, as with prepare_value.
+
+    Args:
+        value (np.ndarray): Numeric array of any dimension.
+
+    Returns:
+        pa.Array: Column of length 1 holding the array as (nested) lists.
+    """
+    flat = np.ascontiguousarray(value).ravel()
+    column = pa.array(flat, mask=np.isnan(flat) if flat.dtype.kind == 'f' else None)
+
+    # Wrap from the innermost dimension : each level groups the previous one by the size of its axis
+    for axis in range(value.ndim - 1, -1, -1):
+        n_lists = int(np.prod(value.shape[:axis]))
+        offsets = pa.array(np.arange(n_lists + 1, dtype=np.int32) * value.shape[axis])
+        column = pa.ListArray.from_arrays(offsets, column)
+
+    return column
+
+
+def downcast_arrays(data: dict) -> dict:
+    """
+    Store the float64 arrays of a result dictionary as float32, and the int64 arrays as int32 when their values fit.
+    Scalars, strings and lists are left unchanged.
+
+    Args:
+        data (dict): Dictionary of results.
+
+    Returns:
+        dict: New dictionary, with the downcast arrays.
+    """
+    int32_info = np.iinfo(np.int32)
+    downcast = {}
+    for key, value in data.items():
+        if isinstance(value, np.ndarray) and value.dtype == np.float64:
+            value = value.astype(np.float32)
+        elif isinstance(value, np.ndarray) and value.dtype == np.int64:
+            if value.size == 0 or (value.min() >= int32_info.min and value.max() <= int32_info.max):
+                value = value.astype(np.int32)
+        downcast[key] = value
+    return downcast
+
+
+def writing_parquet(file:str, title: str, data_result: dict, data_info = False, base_dir: str = "") -> None:
     """
     Write a dictionary directly into a Parquet file using PyArrow.
     Ensures that all numerical values, arrays, and lists are properly handled.
@@ -1531,6 +2188,7 @@ def writing_parquet(file:str, title: str, data_result: dict, data_info = False)
                 - Python scalars (int, float).
                 - Lists (unchanged).
                 - Strings (unchanged).
+        base_dir (str): Folder containing the title folder (the current directory by default).
 
     Returns:
         None: This function does not return any value.
@@ -1545,15 +2203,28 @@ def writing_parquet(file:str, title: str, data_result: dict, data_info = False)
         inspect_data_types(data_result)
 
     # Define the Parquet file path
-    data_file_name = os.path.join(title, f'{file}_{title}.parquet')
+    data_file_name = os.path.join(base_dir, title, f'{file}_{title}.parquet')
 
-    # Prepare the data for Parquet
-    prepared_data = {key: [prepare_value(value)] if not isinstance(value, list) else prepare_value(value)
-                     for key, value in data_result.items()}
+    # Prepare the data for Parquet (numeric arrays are converted by Arrow directly, in their own dtype)
+    prepared_data = {}
+    for key, value in data_result.items():
+        if isinstance(value, np.ndarray) and value.ndim > 0 and value.dtype.kind in 'biuf':
+            prepared_data[key] = array_to_arrow(np.asarray(value))
+        elif isinstance(value, list):
+            prepared_data[key] = prepare_value(value)
+        else:
+            prepared_data[key] = [prepare_value(value)]
 
     try:        
-        table = pa.table(prepared_data)                                         # Create a PyArrow Table from the dictionary
-        pq.write_table(table, data_file_name, compression='gzip')               # Write the table to a Parquet file
+        batch = pa.RecordBatch.from_pydict(prepared_data)                       # A single record : one batch, no intermediate table
+        with pq.ParquetWriter(                                                  # Stream the batch to a Parquet file
+            data_file_name, batch.schema,
+            compression='zstd', compression_level=3,                            # Faster than gzip for a similar ratio on floats
+            use_dictionary=True,                                                # Repeated values (bin centers, parameters) stored once
+            data_page_size=1 << 20,
+            write_statistics=True,
+        ) as writer:
+            writer.write_batch(batch)
 
     except Exception as e:
         print(f"Failed to write Parquet file due to: {e}")
@@ -1609,27 +2280,37 @@ def HiC_map_generation(data: np.ndarray) -> np.ndarray:
     Notes:
     ------
     - The function first filters out values that are greater than or equal to 10,000.
-    - It creates a zero-initialized matrix of shape (10,000 x 10,000).
+    - It creates a zero-initialized matrix of counts of shape (10,000 x 10,000).
     - It iterates over each row of `data` to extract consecutive position pairs.
-    - Each valid (x1, x2) pair is used to increment the corresponding position in `HiC_map`.
+    - All the valid (x1, x2) pairs increment the corresponding positions in `HiC_map` at once (repeated pairs all count).
     - Finally, the Hi-C map is normalized so that its sum equals 1.
     """
 
     size = 10000  # Fixed size of the Hi-C map
-    HiC_map = np.zeros((size, size), dtype=np.float32)  # Use float32 for memory efficiency
+    HiC_map = np.zeros((size, size), dtype=np.uint32)   # Integer counts (4 bytes), normalized to float32 at the end
+
+    # Rows of a 2D array are already views, a list of rows is cast once before the loop
+    if not (isinstance(data, np.ndarray) and data.ndim == 2):
+        data = [np.asarray(row) for row in data]
 
+    x1_rows, x2_rows = [], []
     for array_x in data:
         # Filter out values >= 10000 before processing
-        array_x = np.array(array_x)
-        array_x = array_x[array_x < size]
+        array_x = array_x[array_x < size].astype(np.int16)     # Positions below 10,000 : int16 indices
 
         if len(array_x) > 1:  # Ensure there are at least two values to form a contact
-            contacts = np.stack((array_x[:-1], array_x[1:]), axis=1)
-            x1, x2 = contacts.T.astype(int)  # Convert to integer indices
-            HiC_map[x1, x2] += 1  # Increment contact counts
+            x1_rows.append(array_x[:-1])
+            x2_rows.append(array_x[1:])
+
+    # Increment contact counts : one unbuffered scatter for all the pairs (HiC_map[x1, x2] += 1 drops repeated pairs)
+    if x1_rows:
+        np.add.at(HiC_map, (np.concatenate(x1_rows), np.concatenate(x2_rows)), 1)
 
-    # Normalize to ensure the sum equals 1
-    HiC_map_normed = HiC_map / HiC_map.sum() if HiC_map.sum() > 0 else HiC_map
+    # Normalize to ensure the sum equals 1 (exact integer total, divided in place in float32)
+    total = int(HiC_map.sum(dtype=np.uint64))
+    HiC_map_normed = HiC_map.astype(np.float32)
+    if total > 0:
+        HiC_map_normed /= total
 
     return HiC_map_normed
 
@@ -1651,13 +2332,38 @@ def listoflist_into_matrix(listoflist: list) -> np.ndarray:
     return matrix
 
 
-def find_jumps(x_matrix: np.ndarray, t_matrix) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+def listoflist_into_csr(listoflist: list) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Identifies forward and reverse jump times from position and time matrices.
+    Concatenates a list of lists with varying lengths into one flat array, without any padding.
+    Row i is values[offsets[i]:offsets[i+1]].
+    """
+    lengths = [len(row) for row in listoflist]
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.concatenate(listoflist).astype(np.float64)
+    return values, offsets
+
+
+def unchanged_positions(x_values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Flat mask of the points whose position is the one of the previous point of the same row (x[i][j] == x[i][j-1]).
+    The first point of each row is never masked.
+    """
+    mask = np.zeros(x_values.size, dtype=bool)
+    mask[1:] = x_values[1:] == x_values[:-1]
+    first_points = offsets[:-1]
+    mask[first_points[first_points < x_values.size]] = False
+    return mask
+
+
+def find_jumps(x_values: np.ndarray, t_values: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Identifies forward and reverse jump times from positions and times of all the trajectories.
 
     Args:
-        x_matrix: 2D array of positions.
-        t_matrix: 2D array of cumulative times.
+        x_values: Flat array of positions (see listoflist_into_csr).
+        t_values: Flat array of cumulative times.
+        offsets: Bounds of the trajectories in the flat arrays.
 
     Returns:
         Tuple containing flattened arrays of:
@@ -1666,38 +2372,73 @@ def find_jumps(x_matrix: np.ndarray, t_matrix) -> tuple[np.ndarray, np.ndarray,
             - reverse bind times
             - reverse rest times
     """
-    
-    # Getting all the times (non cumulated) from the t_matrix
-    time = np.diff(t_matrix, axis=1)
-
-    # Initilializaition and filtering where x[i][j] == x[i][j+1]
-    frwd_mask = np.zeros_like(x_matrix, dtype=bool)
-    equal_next = (x_matrix[:, :-1] == x_matrix[:, 1:])
-
-    # Transmit the True from bind_time to corresponding rest_time
-    frwd_mask[:, :-1] |= equal_next
-    frwd_mask[:,  1:] |= equal_next
-    frwd_mask = np.copy(frwd_mask[:, 1:])
-    rvrs_mask = ~ frwd_mask
-    x_matrix = np.copy(x_matrix[:, 1:])    
-    
-    # Forward : select the columns corresponding to bind (odd) and rest (even)
-    frwd_time = frwd_mask * time
-    frwd_time[frwd_time==0] = np.nan  
-    frwd_bind = frwd_time[:, 0::2]
-    frwd_rest = frwd_time[:, 1::2]
-
-    # Reverse : select the columns corresponding to bind (odd) and rest (even)
-    rvrs_time = rvrs_mask * time
-    rvrs_time[rvrs_time==0] = np.nan  
-    rvrs_bind = rvrs_time[:, 0::2]
-    rvrs_rest = rvrs_time[:, 1::2]
-    
-    # print(x_matrix, "\n\n", time, "\n\n", frwd_bind, "\n\n", frwd_rest, "\n\n", rvrs_bind, "\n\n", rvrs_rest)
-    return (np.concatenate(frwd_bind),
-            np.concatenate(frwd_rest),
-            np.concatenate(rvrs_bind), 
-            np.concatenate(rvrs_rest))
+
+    # One fused pass : times (non cumulated), forward / reverse masks and bind / rest columns at once
+    return split_jump_times(
+        np.asarray(x_values, dtype=np.float64),
+        np.asarray(t_values, dtype=np.float64),
+        np.asarray(offsets, dtype=np.int64)
+    )
+
+
+@njit(cache=True, parallel=True)
+def split_jump_times(x_values: np.ndarray, t_values: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compiled core of find_jumps : a single pass on each trajectory, trajectories in parallel.
+    A time is forward if the position does not change at its start or at its end (x[i][j] == x[i][j+1]).
+    Times of the other kind and null times are written as NaN.
+
+    Args:
+        x_values: Flat array of positions.
+        t_values: Flat array of cumulative times.
+        offsets: Bounds of the trajectories in the flat arrays.
+
+    Returns:
+        Tuple containing flattened arrays of:
+            - forward bind times
+            - forward rest times
+            - reverse bind times
+            - reverse rest times
+    """
+    n_rows = offsets.shape[0] - 1
+
+    # Times of the even columns (bind) and of the odd columns (rest) of each trajectory
+    bind_offsets = np.zeros(n_rows + 1, dtype=np.int64)
+    rest_offsets = np.zeros(n_rows + 1, dtype=np.int64)
+    for i in range(n_rows):
+        n_times = max(offsets[i+1] - offsets[i] - 1, 0)
+        bind_offsets[i+1] = bind_offsets[i] + (n_times + 1) // 2
+        rest_offsets[i+1] = rest_offsets[i] + n_times // 2
+    frwd_bind = np.empty(bind_offsets[n_rows])
+    frwd_rest = np.empty(rest_offsets[n_rows])
+    rvrs_bind = np.empty(bind_offsets[n_rows])
+    rvrs_rest = np.empty(rest_offsets[n_rows])
+
+    for i in prange(n_rows):
+        start = offsets[i]
+        n_points = offsets[i+1] - start
+        for j in range(n_points - 1):
+            k = start + j
+            time = t_values[k+1] - t_values[k]
+
+            # Initilializaition and filtering where x[i][j] == x[i][j+1], transmitted from bind_time to rest_time
+            frwd = x_values[k+1] == x_values[k] or (j + 2 < n_points and x_values[k+2] == x_values[k+1])
+
+            # Masked times : the time where the mask holds, NaN elsewhere
+            # (a null time is the rest of a failed binding, not a dwell time : NaN as well)
+            valid = time != 0
+            frwd_time = time if frwd and valid else np.nan
+            rvrs_time = time if not frwd and valid else np.nan
+
+            # Select the columns corresponding to bind (even) and rest (odd)
+            if j % 2 == 0:
+                frwd_bind[bind_offsets[i] + j // 2] = frwd_time
+                rvrs_bind[bind_offsets[i] + j // 2] = rvrs_time
+            else:
+                frwd_rest[rest_offsets[i] + j // 2] = frwd_time
+                rvrs_rest[rest_offsets[i] + j // 2] = rvrs_time
+
+    return frwd_bind, frwd_rest, rvrs_bind, rvrs_rest
     
     
 def calculate_nature_jump_distribution(t_matrix: np.ndarray,
@@ -1725,17 +2466,18 @@ def calculate_nature_jump_distribution(t_matrix: np.ndarray,
    
     """
 
-    # Get the datas
-    t_full = listoflist_into_matrix(t_matrix)
-    x_full = listoflist_into_matrix(x_matrix)
-    fb_array, fr_array, rb_array, rr_array = find_jumps(x_full, t_full)
-    
-    # Get the distributions of datas
-    _, fb_y = calculate_distribution(data=fb_array, first_bin=first_bin, last_bin=last_bin, bin_width=bin_width)
-    _, fr_y = calculate_distribution(data=fr_array, first_bin=first_bin, last_bin=last_bin, bin_width=bin_width)
-    _, rb_y = calculate_distribution(data=rb_array, first_bin=first_bin, last_bin=last_bin, bin_width=bin_width)
-    _, rr_y = calculate_distribution(data=rr_array, first_bin=first_bin, last_bin=last_bin, bin_width=bin_width)
+    # Get the datas (flat, no padding)
+    t_values, offsets = listoflist_into_csr(t_matrix)
+    x_values, _ = listoflist_into_csr(x_matrix)
+    fb_array, fr_array, rb_array, rr_array = find_jumps(x_values, t_values, offsets)
     
+    # Get the distributions of datas : four independent histograms, filled without the GIL
+    def distribution(data: np.ndarray) -> np.ndarray:
+        return calculate_distribution(data=data, first_bin=first_bin, last_bin=last_bin, bin_width=bin_width)[1]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        fb_y, fr_y, rb_y, rr_y = executor.map(distribution, (fb_array, fr_array, rb_array, rr_array))
+
     return fb_y, fr_y, rb_y, rr_y
 
 
@@ -1743,6 +2485,29 @@ def exp_decay(t, y0, tau):
     return y0 * np.exp(-t / tau)
 
 
+def fit_exp_decay(x: np.ndarray, y: np.ndarray, p0: tuple) -> tuple[float, float]:
+    """
+    Fits exp_decay with curve_fit, started from a closed form guess : linear regression of log(y) on x,
+    on the positive values, weighted by y. The guess is already close to the least squares on y,
+    so that Levenberg-Marquardt converges in a few iterations.
+
+    Args:
+        x: Bin centers or time points.
+        y: Distribution to fit.
+        p0: Initial guess (y0, tau), used when the closed form guess is not available.
+
+    Returns:
+        Tuple of the initial value and the decay constant (y0, tau).
+    """
+    positive = y > 0
+    if np.count_nonzero(positive) >= 2:                         # No line through less than two points
+        slope, intercept = np.polyfit(x[positive], np.log(y[positive]), 1, w=y[positive])
+        if slope < 0:
+            p0 = (np.exp(intercept), -1.0 / slope)
+
+    return tuple(curve_fit(exp_decay, x, y, p0=p0)[0])
+
+
 def extracting_taus(
     fb_y: np.ndarray, 
     fr_y: np.ndarray, 
@@ -1764,10 +2529,10 @@ def extracting_taus(
         Tuple of decay constants and initial values for all four distributions.
     """
 
-    y0_fb, tau_fb = curve_fit(exp_decay, array, fb_y, p0=(fb_y[0], 1.0))[0]
-    y0_fr, tau_fr = curve_fit(exp_decay, array, fr_y, p0=(fr_y[0], 1.0))[0]
-    y0_rb, tau_rb = curve_fit(exp_decay, array, rb_y, p0=(rb_y[0], 1.0))[0]
-    y0_rr, tau_rr = curve_fit(exp_decay, array, rr_y, p0=(rr_y[0], 1.0))[0]
+    y0_fb, tau_fb = fit_exp_decay(array, fb_y, p0=(fb_y[0], 1.0))
+    y0_fr, tau_fr = fit_exp_decay(array, fr_y, p0=(fr_y[0], 1.0))
+    y0_rb, tau_rb = fit_exp_decay(array, rb_y, p0=(rb_y[0], 1.0))
+    y0_rr, tau_rr = fit_exp_decay(array, rr_y, p0=(rr_y[0], 1.0))
 
     return tau_fb, tau_fr, tau_rb, tau_rr, y0_fb, y0_fr, y0_rb, y0_rr
 
@@ -1793,21 +2558,25 @@ def getting_forwards(
         Tuple of bin centers and forward time distribution.
     """
 
-    # Get the datas
-    t_full = listoflist_into_matrix(t_matrix)
-    x_full = listoflist_into_matrix(x_matrix)
+    # Get the datas (flat, no padding)
+    t_values, offsets = listoflist_into_csr(t_matrix)
+    x_values, _ = listoflist_into_csr(x_matrix)
+
+    mask = unchanged_positions(x_values, offsets)
 
-    mask = np.zeros_like(x_full, dtype=bool)
-    matches = (x_full[:, :-1] == x_full[:, 1:])
-    mask[:, 1:] = matches
+    array = mask * t_values
+    kept = (array != 0) & ~np.isnan(array)
+    values = array[kept]
 
-    array = mask * t_full
-    result = np.concatenate([
-        np.insert(row[(row != 0 ) & ~np.isnan(row)], 0, 0)
-        for row in array
-    ])
+    # Differences with the previous kept time of the same trajectory, from 0 at the start of each one
+    trajectory_id = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))[kept]
+    first = np.ones(values.size, dtype=bool)
+    first[1:] = trajectory_id[1:] != trajectory_id[:-1]
+    previous = np.empty_like(values)
+    previous[1:] = values[:-1]
+    previous[first] = 0
 
-    diff = np.diff(result)
+    diff = values - previous
     frwd_times = diff[diff > 0]
 
     points, distrib_forwards = calculate_distribution(frwd_times, first_bin, last_bin, bin_width)
@@ -1835,28 +2604,22 @@ def getting_reverses(
         Tuple of bin centers and reverse dwell time distribution.
     """
 
-    # Get the datas
-    t_full = listoflist_into_matrix(t_matrix)
-    x_full = listoflist_into_matrix(x_matrix)
-
-    # Rajouter les listoflist in matrix
-    times = t_full[:, 0::2]
+    # Get the datas (flat, no padding)
+    t_values, offsets = listoflist_into_csr(t_matrix)
+    x_values, _ = listoflist_into_csr(x_matrix)
 
-    mask = np.zeros_like(x_full, dtype=bool)
-    matches = (x_full[:, :-1] == x_full[:, 1:])
-    mask[:, 1:] = matches
-    filter = mask[:, 0::2]
+    # Even columns of each trajectory
+    columns = np.arange(x_values.size) - np.repeat(offsets[:-1], np.diff(offsets))
+    even = np.flatnonzero(columns % 2 == 0)
+    times = t_values[even]
+    filter = unchanged_positions(x_values, offsets)[even]
 
-    dwell = []
+    # Last False of the trajectory at each point (running maximum : the first point of a trajectory is always False),
+    # then one gather at the True entries
+    last_false = np.maximum.accumulate(np.where(filter, 0, np.arange(filter.size)))
+    dwell = times[filter] - times[last_false[filter]]
 
-    for i in range (len(filter)):
-        for j in range(len(filter[0])):
-            if filter[i][j] == False:
-                false_value = times[i][j]
-            if filter[i][j] == True:
-                dwell.append(times[i][j] - false_value)
-
-    points, distrib_reverses = calculate_distribution(np.array(dwell), first_bin, last_bin, bin_width)
+    points, distrib_reverses = calculate_distribution(dwell, first_bin, last_bin, bin_width)
     return points, distrib_reverses
 
 
@@ -1912,7 +2675,7 @@ def find_dwell_times(
     # Fitting
     def safe_fit(x, y, p0):
         try:
-            return curve_fit(exp_decay, x, y, p0=p0)[0]
+            return fit_exp_decay(x, y, p0=p0)
         except:
             return np.nan, np.nan
 
@@ -1924,6 +2687,30 @@ def find_dwell_times(
     return tau_forwards, tau_reverses, y0_forwards, y0_reverses 
 
 
+def theoretical_speed(alphaf, alphao, s, l, mu, lmbda, rtot_bind, rtot_rest):
+    """
+    Theoretical speed : mean acceptance over a nucleosome and its linker, times the mean jump, over the mean cycle time.
+    Only arithmetic operations : the parameters can be scalars or NumPy arrays (a whole grid at once).
+
+    Args:
+        alphaf (float): Acceptance probability on linker sites.
+        alphao (float): Acceptance probability on nucleosome sites.
+        s (int): Nucleosome size.
+        l (int): Linker length.
+        mu (float): Mean jump length.
+        lmbda (float): Lambda parameter for the simulation.
+        rtot_bind (float): Reaction rate for binding.
+        rtot_rest (float): Reaction rate for resting.
+
+    Returns:
+        float or np.ndarray: Theoretical speed.
+    """
+    p_alpha = (s*alphao + l*alphaf) / (l+s) * (1-lmbda)
+    t_alpha = (1 / rtot_bind) + (1 / rtot_rest)
+    x_alpha = mu
+    return p_alpha / t_alpha * x_alpha
+
+
 # ================================================
 # Part 3.1 : Main function
 # ================================================
@@ -1938,7 +2725,8 @@ def sw_nucleo(
     Lmin: int, Lmax: int, bps: int, origin: int,
     tmax: float, dt: float, 
     algorithm_choice = "two_steps",
-    saving = "map"
+    saving = "map",
+    output_dir: str = ""
     ) -> None:
     """
     Simulates condensin dynamics along chromatin with specified parameters.
@@ -1966,6 +2754,7 @@ def sw_nucleo(
         dt (float): Time step increment.
         algorithm_choice (str): Choice of algorithm for the modeling.
         saving (bool): Whether to save the results and in which kind.
+        output_dir (str): Folder where the results are written (the current directory by default).
     Returns:
         None: This function does not return any value. It performs a simulation and saves results in a file.
 
@@ -1977,17 +2766,10 @@ def sw_nucleo(
     # --- Initialization --- #
 
     # File
-    title = (
-            f"alphachoice={alpha_choice}_s={s}_l={l}_bpmin={bpmin}_"
-            f"mu={mu}_theta={theta}_"
-            f"lmbda={lmbda:.2e}_rtotbind={rtot_bind:.2e}_rtotrest={rtot_rest:.2e}_"
-            f"nt={nt}"
-            )
-    if not os.path.exists(title):
-        os.mkdir(title)
+    title = simulation_title(alpha_choice, s, l, bpmin, mu, theta, lmbda, rtot_bind, rtot_rest, nt)
+    os.makedirs(os.path.join(output_dir, title), exist_ok=True)
 
-    # Chromatin
-    L = np.arange(Lmin, Lmax, bps)
+    # Chromatin : number of sites (the array of the sites is only built for the two steps algorithm, its jumps)
     lenght = (Lmax-Lmin) // bps
 
     # Calibration 
@@ -2005,112 +2787,64 @@ def sw_nucleo(
 
     # Chromatin : Landscape + Obstacles and Linkers
     alpha_matrix, alpha_mean = alpha_matrix_calculation(alpha_choice, s, l, bpmin, alphao, alphaf, Lmin, Lmax, bps, nt)
-    obs_points, obs_distrib, link_points, link_distrib = calculate_obs_and_linker_distribution(alpha_matrix[0], alphao, alphaf)
-    link_view = calculate_linker_landscape(alpha_matrix, alpha_choice, nt, alphaf, Lmin, Lmax)
 
     # Probabilities
-    p = proba_gamma(mu, theta, L)
+    p = proba_gamma_on_grid(mu, theta, Lmin, Lmax, bps)
 
     # Modeling - Gillespie 1 step or 2 steps
     if algorithm_choice == "one_step":
         results, t_matrix, x_matrix = gillespie_algorithm_one_step(nt, tmax, dt, alpha_matrix, beta, Lmax, lenght, origin, p)
     elif algorithm_choice == "two_steps":
+        L = np.arange(Lmin, Lmax, bps)
         results, t_matrix, x_matrix = gillespie_algorithm_two_steps(alpha_matrix, p, beta, lmbda, rtot_bind, rtot_rest, nt, tmax, dt, L, origin)
 
     # Results
     results_mean, results_med, results_std, v_mean, v_med = calculate_main_results(results, dt, alpha_0, nt)
-    vf, Cf, wf, vf_std, Cf_std, wf_std, xt_over_t, G, bound_low, bound_high = fitting_in_two_steps(times, results_mean, results_std)
-
-    # Positions
-    # xbj_points, xbj_distrib = calculate_distribution_of_jump_size(x_matrix, x_fb, x_lb, x_bw)
-
-    # Times : First pass times + Waiting times + Forward and Reverse times
-    fpt_distrib_2D, fpt_number = calculate_fpt_matrix(t_matrix, x_matrix, tmax, bin_fpt)
-    tbj_points, tbj_distrib = calculate_distrib_tbjs(t_matrix)
-
-    # Speeds
-    dx_points, dx_distrib, dx_mean, dx_med, dx_mp, dt_points, dt_distrib, dt_mean, dt_med, dt_mp, vi_points, vi_distrib, vi_mean, vi_med, vi_mp = calculate_instantaneous_statistics(t_matrix, x_matrix, nt)
-
-
-    # --------- Working area --------- #
-
-
-    # 2.1 : Forward and Reverse calculation
-    fb_y, fr_y, rb_y, rr_y = calculate_nature_jump_distribution(t_matrix, x_matrix, t_fb, t_lb, t_bw)
-    tau_fb, tau_fr, tau_rb, tau_rr, y0_fb, y0_fr, y0_rb, y0_rr = extracting_taus(fb_y, fr_y, rb_y, rr_y, t_bins)
-
-
-    # 2.2 New Forwards Reverses
-    xf_points, yf_points = getting_forwards(t_matrix, x_matrix, t_fb, t_lb, t_bw)
-    xr_points, yr_points = getting_reverses(t_matrix, x_matrix, t_fb, t_lb, t_bw)
-    tau_forwards, tau_reverses, y0_forwards, y0_reverses = find_dwell_times(xf_points, distrib_forwards=yf_points, distrib_reverses=yr_points, xmax=100)
-
-    # # 2.3 Plot
-    # fig, axes = plt.subplots(1, 2, figsize=(16, 6))
-
-    # ax = axes[0]
-    # ax.plot(t_bins, fb_y, label="forward_bind")
-    # ax.plot(t_bins, fr_y, label="forward_rest")
-    # ax.plot(t_bins, rb_y, label="reverse_bind")
-    # ax.plot(t_bins, rr_y, label="reverse_rest")
-    # ax.plot(t_bins, exp_decay(t_bins, y0_fb, tau_fb), label=f"tau_fb={tau_fb:.2f}", ls="--")
-    # ax.plot(t_bins, exp_decay(t_bins, y0_fr, tau_fr), label=f"tau_fr={tau_fr:.2f}", ls="--")
-    # ax.plot(t_bins, exp_decay(t_bins, y0_rb, tau_rb), label=f"tau_rb={tau_rb:.2f}", ls="--")
-    # ax.plot(t_bins, exp_decay(t_bins, y0_rr, tau_rr), label=f"tau_rr={tau_rr:.2f}", ls="--")
-    # ax.set_xlim([0, 50])
-    # ax.grid(True)
-    # ax.legend()
-    # ax.set_title("Forward vs Reverse by us")
-    # ax.set_xlabel("Bins")
-    # ax.set_ylabel("Density")
-
-    # ax = axes[1]
-    # ax.plot(xf_points, yf_points, label="forward", c="r", lw=0.5)
-    # ax.plot(xr_points, yr_points, label="reverse", c="b", lw=0.5)
-    # ax.plot(xf_points, exp_decay(xf_points, y0_forwards, tau_forwards), label=f"tau_forwards={tau_forwards:.2f}", ls="--", c="r")
-    # ax.plot(xr_points, exp_decay(xr_points, y0_reverses, tau_reverses), label=f"tau_reverses={tau_reverses:.2f}", ls="--", c="b")
-    # ax.set_xlim([0,50])
-    # ax.grid(True)
-    # ax.legend()
-    # ax.set_title("Forward vs Reverse by Ryu")
-    # ax.set_xlabel("Bins")
-    # ax.set_ylabel("Density")
-
-    # plt.tight_layout()
-    # plt.savefig("/home/nicolas/Documents/Workspace/nucleo/outputs/output.png")
-    # plt.close()
-
-
-    # 1. Speed value in function of lmbda
-    def theoretical_speed(alphaf, alphao, s, l, mu, lmbda, rtot_bind, rtot_rest):
-        p_alpha = (s*alphao + l*alphaf) / (l+s) * (1-lmbda)
-        t_alpha = (1 / rtot_bind) + (1 / rtot_rest)
-        x_alpha = mu
-        return p_alpha / t_alpha * x_alpha
-    
-    v_th = theoretical_speed(alphaf, alphao, s, l, mu, lmbda, rtot_bind, rtot_rest)
 
-    rtot_bind_fit = ((tau_fb + tau_rb) / 2) ** -1
-    rtot_rest_fit = ((tau_fr + tau_rr) / 2) ** -1
-    v_fit = theoretical_speed(alphaf, alphao, s, l, mu, lmbda, rtot_bind_fit, rtot_rest_fit)
 
-    # # Prints of speed
-    # print(f"v_mean = {v_mean:.2f}")
-    # print(f"v_th = {v_th:.2f}")
-    # print(f"v_fit = {v_fit:.2f}")
+    # --- Analysis : only the quantities written by the chosen saving --- #
+
+    if saving == "data":
+
+        # Obstacles and Linkers
+        obs_points, obs_distrib, link_points, link_distrib = calculate_obs_and_linker_distribution(alpha_matrix[0], alphao, alphaf)
+        link_view = calculate_linker_landscape(alpha_matrix, alpha_choice, nt, alphaf, Lmin, Lmax)
+
+        # Fits of the mean position
+        vf, Cf, wf, vf_std, Cf_std, wf_std, xt_over_t, G, bound_low, bound_high = fitting_in_two_steps(times, results_mean, results_std)
+
+        # Positions
+        # xbj_points, xbj_distrib = calculate_distribution_of_jump_size(x_matrix, x_fb, x_lb, x_bw)
+
+        # Times : First pass times + Waiting times
+        fpt_distrib_2D, fpt_number = calculate_fpt_matrix(t_matrix, x_matrix, tmax, bin_fpt)
+        tbj_points, tbj_distrib = calculate_distrib_tbjs(t_matrix)
+
+        # Speeds
+        dx_points, dx_distrib, dx_mean, dx_med, dx_mp, dt_points, dt_distrib, dt_mean, dt_med, dt_mp, vi_points, vi_distrib, vi_mean, vi_med, vi_mp = calculate_instantaneous_statistics(t_matrix, x_matrix, nt)
+
+    elif saving == "map":
 
-    print(x_matrix[0])
-    print(t_matrix[0])
+        # Forward and Reverse times : rates of bind and rest fitted on the four distributions
+        fb_y, fr_y, rb_y, rr_y = calculate_nature_jump_distribution(t_matrix, x_matrix, t_fb, t_lb, t_bw)
+        tau_fb, tau_fr, tau_rb, tau_rr, y0_fb, y0_fr, y0_rb, y0_rr = extracting_taus(fb_y, fr_y, rb_y, rr_y, t_bins)
 
+        # Forward and Reverse dwell times
+        xf_points, yf_points = getting_forwards(t_matrix, x_matrix, t_fb, t_lb, t_bw)
+        xr_points, yr_points = getting_reverses(t_matrix, x_matrix, t_fb, t_lb, t_bw)
+        tau_forwards, tau_reverses, y0_forwards, y0_reverses = find_dwell_times(xf_points, distrib_forwards=yf_points, distrib_reverses=yr_points, xmax=100)
 
-    # --------- ------------#
+        # Speed value in function of lmbda : theoretical and with the fitted rates
+        v_th = theoretical_speed(alphaf, alphao, s, l, mu, lmbda, rtot_bind, rtot_rest)
+        rtot_bind_fit = ((tau_fb + tau_rb) / 2) ** -1
+        rtot_rest_fit = ((tau_fr + tau_rr) / 2) ** -1
+        v_fit = theoretical_speed(alphaf, alphao, s, l, mu, lmbda, rtot_bind_fit, rtot_rest_fit)
 
 
     # --- Writing --- #
 
-    # First cleaning
+    # Cleaning : the landscapes (nt x Lmax for ntrandom) are released before composing the results
     del alpha_matrix
-    gc.collect()
 
     # Composing the main result that will be written
     if saving == "data":
@@ -2144,6 +2878,7 @@ def sw_nucleo(
             'alpha_0':alpha_0, 
             'xt_over_t':xt_over_t, 'G':G, 'bound_low':bound_low, 'bound_high':bound_high
         }
+        data_result = downcast_arrays(data_result)      # Distributions and curves : float32 precision is enough on disk
 
     elif saving == "map":
         data_result = {
@@ -2159,15 +2894,7 @@ def sw_nucleo(
         }
 
     # Writing event
-    writing_parquet(path, title, data_result)
-
-    # Second cleaning
-    for key in list(data_result.keys()):
-        del data_result[key]
-        if key in locals():
-            del locals()[key]
-    del data_result 
-    gc.collect()
+    writing_parquet(path, title, data_result, base_dir=output_dir)
 
     # Done
     return None
@@ -2369,7 +3096,7 @@ def choose_configuration(config: str):
             path)                                                       # folder
 
 
-def process_function(params: tuple) -> None:
+def process_function(params: tuple, output_dir: str = "") -> None:
     """
     Execute a single process with the given parameters.
 
@@ -2381,16 +3108,23 @@ def process_function(params: tuple) -> None:
             - alpha_choice (str): Choice of alpha configuration.
             - mu (float): Mean value for the distribution.
             - theta (float): Standard deviation for the distribution.
+        output_dir (str): Folder where the results are written.
 
     Returns:
         None: This function does not return any value. It triggers the process defined by `sw_nucleo`.
 
     Note:
         - The function assumes that `sw_nucleo` is defined elsewhere in the code and takes the listed parameters.
+        - A parameter set whose Parquet file already exists in `output_dir` is skipped.
     """
     # Unpack parameters from the input tuple
     alpha_choice, s, l, bpmin, mu, theta, lmbda, alphao, alphaf, beta, rtot_bind, rtot_rest, nt, path = params
 
+    # Already computed (resumed sweep) : nothing to do
+    title = simulation_title(alpha_choice, s, l, bpmin, mu, theta, lmbda, rtot_bind, rtot_rest, nt)
+    if os.path.exists(os.path.join(output_dir, title, f'{path}_{title}.parquet')):
+        return None
+
     # Getting the verification on inputs
     checking_inputs(
         alpha_choice=alpha_choice, s=s, l=l, bpmin=bpmin, 
@@ -2401,8 +3135,26 @@ def process_function(params: tuple) -> None:
     )
 
     # Call the `sw_nucleo` function with the given parameters
-    sw_nucleo(alpha_choice, s, l, bpmin, mu, theta, lmbda, alphao, alphaf, beta, rtot_bind, rtot_rest, nt, path, Lmin, Lmax, bps, origin, tmax, dt)
+    sw_nucleo(alpha_choice, s, l, bpmin, mu, theta, lmbda, alphao, alphaf, beta, rtot_bind, rtot_rest, nt, path, Lmin, Lmax, bps, origin, tmax, dt, output_dir=output_dir)
+
+    return None
 
+
+def safe_process_function(params: tuple, output_dir: str = "") -> None:
+    """
+    Run process_function, reporting its exception instead of raising it : a failed parameter set does not stop the others.
+
+    Args:
+        params (tuple): Parameters of the process (see process_function).
+        output_dir (str): Folder where the results are written.
+
+    Returns:
+        None
+    """
+    try:
+        process_function(params, output_dir)
+    except Exception as e:
+        print(f"Process failed with exception: {e}")
     return None
 
 
@@ -2423,10 +3175,13 @@ def execute_in_parallel(config: str, execution_mode: str) -> None:
         None: This function does not return any value.
 
     Note:
-        - The function divides the parameter list into tasks based on the task ID and total number of tasks.
-        - A working directory is created for each task to isolate its execution environment.
+        - The function deals the parameter list round-robin between the tasks, based on the task ID and total number of tasks.
+        - An output directory is created for each task and passed to the workers (the current directory is not changed).
         - The number of processes used in parallel is defined by `num_cores_used` (for 'PSMN') 
           or set manually (for 'PC').
+        - The workers are forked and reused for 32 chunks of parameter sets : they inherit the loaded modules 
+          and the constants of the main block (Lmin, Lmax, tmax, dt...), which spawned workers would not see.
+          Every new worker (replacements included) reseeds np.random after the fork (see reset_random_pool).
 
     Raises:
         Exception: Captures and logs any exceptions raised during process execution.
@@ -2434,29 +3189,24 @@ def execute_in_parallel(config: str, execution_mode: str) -> None:
     # Inputs
     alpha_choice_values, s_values, l_values, bpmin_values, mu_values, theta_values, lmbda_values, alphao, alphaf, beta, rtot_bind_values, rtot_rest_values, nt, path = choose_configuration(config)
 
-    # Generate the list of parameters for all combinations
-    params_list = [
-        (alpha_choice, s, l, bpmin, mu, theta, lmbda, alphao, alphaf, beta, rtot_bind, rtot_rest, nt, path)
-        for alpha_choice in alpha_choice_values
-        for s in s_values
-        for l in l_values
-        for bpmin in bpmin_values
-        for mu in mu_values
-        for theta in theta_values
-        for lmbda in lmbda_values
-        for rtot_bind in rtot_bind_values
-        for rtot_rest in rtot_rest_values
-    ]
-
-    # Divide the parameter list into chunks for parallel execution
-    chunk_size = len(params_list) // num_tasks
-    start = task_id * chunk_size
-    end = start + chunk_size if task_id < num_tasks - 1 else len(params_list)
-    params_list_task = params_list[start:end]
+    # Grid of all combinations, walked lazily in the order of nested loops (alpha_choice outermost, rtot_rest innermost)
+    grids = (alpha_choice_values, s_values, l_values, bpmin_values, mu_values, theta_values, lmbda_values, rtot_bind_values, rtot_rest_values)
+    n_params = math.prod(len(values) for values in grids)
+
+    def parameter_sets(start: int, end: int, step: int = 1) -> list:
+        # Only the tuples of the combinations start, start + step, ... before end are built
+        return [
+            (alpha_choice, s, l, bpmin, mu, theta, lmbda, alphao, alphaf, beta, rtot_bind, rtot_rest, nt, path)
+            for alpha_choice, s, l, bpmin, mu, theta, lmbda, rtot_bind, rtot_rest in islice(product(*grids), start, end, step)
+        ]
+
+    # Deal the combinations round-robin between the tasks : the cost grows along the axes (larger mu, smaller rates),
+    # so contiguous chunks would leave the last tasks with the longest simulations
+    params_list_task = parameter_sets(task_id, n_params, num_tasks)
 
     # Set up the working environment for the current task
     folder_name = f"{path}_{task_id}"
-    set_working_environment(subfolder=folder_name)
+    output_dir = set_working_environment(subfolder=folder_name)
 
 
     # --- Execution modes --- #
@@ -2465,13 +3215,13 @@ def execute_in_parallel(config: str, execution_mode: str) -> None:
     if execution_mode == 'PSMN':
         num_processes = num_cores_used
 
-        with ProcessPoolExecutor(max_workers=num_processes) as executor:
-            futures = {executor.submit(process_function, params): params for params in params_list_task}
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    print(f"Process failed with exception: {e}")
+        # Jobs sent by chunks (about 4 per worker) : one pickle round-trip per chunk, errors reported by the workers
+        # Workers replaced after 32 chunks : long sweeps do not accumulate memory in the same processes
+        # (a replacement is forked from the parent, the after-fork hook gives it its own seeds)
+        chunksize = max(1, len(params_list_task) // (num_processes * 4))
+        with get_context("fork").Pool(num_processes, maxtasksperchild=32) as pool:
+            for _ in pool.imap_unordered(partial(safe_process_function, output_dir=output_dir), params_list_task, chunksize=chunksize):
+                pass
         return None
 
     # Execution locally on PC -> /home/nicolas/Documents/Progs/
@@ -2479,21 +3229,20 @@ def execute_in_parallel(config: str, execution_mode: str) -> None:
         # num_processes = 2
         num_processes = 12
 
-        with ProcessPoolExecutor(max_workers=num_processes) as executor:
-            futures = {executor.submit(process_function, params): params for params in params_list}
-            for future in tqdm(as_completed(futures), total=len(futures), desc="Processing"):
-                try:
-                    future.result()
-                except Exception as e:
-                    print(f"Process failed with exception: {e}")
+        params_list = parameter_sets(0, n_params)
+        chunksize = max(1, len(params_list) // (num_processes * 4))
+        with get_context("fork").Pool(num_processes, maxtasksperchild=32) as pool:
+            results = pool.imap_unordered(partial(safe_process_function, output_dir=output_dir), params_list, chunksize=chunksize)
+            for _ in tqdm(results, total=len(params_list), desc="Processing"):
+                pass
         return None
     
     if execution_mode == 'SNAKEVIZ':
         folder_path = os.path.join(os.getcwd(), f"/home/nicolas/tests/{path}_{task_id}")
-        set_working_environment(folder_path)
-        for params in tqdm(params_list, desc="Processing sequentially"):
+        output_dir = set_working_environment(folder_path)
+        for params in tqdm(parameter_sets(0, n_params), desc="Processing sequentially"):
             try:
-                process_function(params)
+                process_function(params, output_dir)
             except Exception as e:
                 print(f"Process failed with exception: {e}")
         return None
@@ -2524,7 +3273,6 @@ def main():
     except Exception as e:
         print(f"Process failed: {e}")
 
-    os.chdir(initial_adress)
     end_time = time.time()
     elapsed_time = end_time - start_time
     print(f'\n#- Finished in {int(elapsed_time // 60)}m at {initial_adress} -#\n')